@@ -119,10 +119,13 @@ class QolabaHTTPClient:
             if self.settings.https_proxy:
                 proxies["https://"] = self.settings.https_proxy
             
-            # Configure client with connection pooling
+            # Size the pool to the server's concurrency budgets so requests
+            # admitted by the semaphores never queue again inside httpx.
             limits = httpx.Limits(
                 max_keepalive_connections=10,
-                max_connections=20,
+                max_connections=(
+                    self.settings.max_concurrency + self.settings.max_status_concurrency
+                ),
                 keepalive_expiry=30.0
             )
             
@@ -293,7 +296,9 @@ class QolabaHTTPClient:
         
         # Calculate request size for performance logging
         request_size = 0
-        if 'json' in kwargs:
+        if kwargs.get('content') is not None:
+            request_size = len(kwargs['content'])
+        elif 'json' in kwargs:
             import json
             request_size = len(json.dumps(kwargs['json']).encode('utf-8'))
         elif 'data' in kwargs:
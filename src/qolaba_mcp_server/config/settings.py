@@ -41,6 +41,12 @@ class QolabaSettings(BaseSettings):
     # Networking
     request_timeout: float = Field(default=30.0, ge=0.1, description="Request timeout in seconds")
     verify_ssl: bool = Field(default=True, description="Verify TLS certificates for HTTPS requests")
+    max_concurrency: int = Field(
+        default=16, ge=1, description="Maximum concurrent upstream generation/chat requests"
+    )
+    max_status_concurrency: int = Field(
+        default=4, ge=1, description="Maximum concurrent upstream task status requests"
+    )
 
     # Proxies (optional)
     http_proxy: Optional[str] = Field(default=None, description="HTTP proxy URL")
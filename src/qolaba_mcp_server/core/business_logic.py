@@ -33,6 +33,8 @@ from ..models.api_models import (
 from ..mcp.validation import ValidationResult, validate_request_data
 from ..mcp.responses import (
     ResponseSerializer,
+    ResponseStatus,
+    RESPONSE_STATUS_BY_VALUE,
     MCPResponseBase,
     MCPErrorResponse,
     process_qolaba_response
@@ -269,12 +271,13 @@ class QolabaMCPOrchestrator:
                 response = await client.get(f"task-status/{task_id}")
 
                 if isinstance(response.content, dict):
-                    # Create task status response from API data
-                    from ..mcp.responses import ResponseStatus
-
+                    # Create task status response from API data; unknown
+                    # upstream statuses are reported as pending
                     mcp_response = ResponseSerializer.create_task_status_response(
                         task_id=task_id,
-                        status=ResponseStatus(response.content.get("status", "pending")),
+                        status=RESPONSE_STATUS_BY_VALUE.get(
+                            response.content.get("status", "pending"), ResponseStatus.PENDING
+                        ),
                         progress=float(response.content.get("progress", 0.0)),
                         result=response.content.get("result"),
                         error_details=response.content.get("error"),
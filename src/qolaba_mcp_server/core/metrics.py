@@ -22,7 +22,7 @@ except Exception:  # pragma: no cover - optional dependency in some environments
 import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from threading import Lock
+from threading import Lock, RLock
 from typing import Any, Dict, List, Optional, Union, Callable, ContextManager
 from dataclasses import dataclass, field
 from enum import Enum
@@ -148,7 +148,8 @@ class MetricsCollector:
     def __init__(self):
         if not hasattr(self, '_initialized'):
             self._metrics: Dict[str, Metric] = {}
-            self._metric_lock = Lock()
+            # Re-entrant: auto-registration and export re-acquire it internally
+            self._metric_lock = RLock()
             self._start_time = time.time()
             self._request_count = 0
             self._error_count = 0
@@ -7,6 +7,7 @@ systems, load balancers, and monitoring tools to check system health.
 
 from __future__ import annotations
 
+import logging
 import time
 from typing import Dict, Any, Optional
 from fastapi import HTTPException, Request
@@ -245,12 +246,13 @@ async def readiness_probe_endpoint(request: Request) -> JSONResponse:
         
         response_data["response_time_ms"] = round((time.time() - start_time) * 1000, 2)
         
-        logger.debug("Readiness probe completed", extra={
-            "request_id": request_id,
-            "ready": response_data["ready"],
-            "system_status": system_health.status.value,
-            "response_time_ms": response_data["response_time_ms"]
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Readiness probe completed", extra={
+                "request_id": request_id,
+                "ready": response_data["ready"],
+                "system_status": system_health.status.value,
+                "response_time_ms": response_data["response_time_ms"]
+            })
         
         return JSONResponse(
             content=response_data,
@@ -314,12 +316,13 @@ async def liveness_probe_endpoint(request: Request) -> JSONResponse:
             "response_time_ms": round((time.time() - start_time) * 1000, 2)
         }
         
-        logger.debug("Liveness probe completed", extra={
-            "request_id": request_id,
-            "alive": True,
-            "uptime_seconds": uptime,
-            "response_time_ms": response_data["response_time_ms"]
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Liveness probe completed", extra={
+                "request_id": request_id,
+                "alive": True,
+                "uptime_seconds": uptime,
+                "response_time_ms": response_data["response_time_ms"]
+            })
         
         return JSONResponse(
             content=response_data,
@@ -21,6 +21,7 @@ from .validation import (
 
 from .responses import (
     ResponseStatus,
+    RESPONSE_STATUS_BY_VALUE,
     MCPResponseType,
     MCPResponseBase,
     MCPTaskResponse,
@@ -49,6 +50,7 @@ __all__ = [
 
     # Response components
     "ResponseStatus",
+    "RESPONSE_STATUS_BY_VALUE",
     "MCPResponseType",
     "MCPResponseBase",
     "MCPTaskResponse",
@@ -10,7 +10,8 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 from enum import Enum
 
 from pydantic import BaseModel, Field, validator
@@ -28,8 +29,17 @@ class ResponseStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
+    # Reported by the API for tasks stopped before finishing; terminal like
+    # COMPLETED/FAILED, so pollers and the task cache can stop on it
+    CANCELLED = "cancelled"
 
 
+# Value -> member lookup for upstream status strings, so hot paths can use a
+# plain mapping instead of calling the Enum constructor.
+RESPONSE_STATUS_BY_VALUE: Mapping[str, ResponseStatus] = MappingProxyType(
+    {status.value: status for status in ResponseStatus}
+)
+
 class MCPResponseType(str, Enum):
     """Types of MCP responses."""
     TASK_CREATED = "task_created"
@@ -275,7 +285,7 @@ class ResponseSerializer:
     def serialize_to_dict(response: MCPResponseBase) -> Dict[str, Any]:
         """Serialize response to dictionary format."""
         try:
-            data = response.dict(exclude_none=True)
+            data = response.model_dump(exclude_none=True)
             # Backward-compat fields for error responses expected by some tests
             if data.get("response_type") in (MCPResponseType.ERROR, "error"):
                 data.setdefault("error", data.get("error_code"))
@@ -286,20 +296,20 @@ class ResponseSerializer:
             return ResponseSerializer.create_error_response(
                 "serialization_error",
                 f"Failed to serialize response: {e}"
-            ).dict(exclude_none=True)
+            ).model_dump(exclude_none=True)
 
     @staticmethod
     def serialize_to_json(response: MCPResponseBase, indent: Optional[int] = None) -> str:
         """Serialize response to JSON string."""
         try:
-            return response.json(exclude_none=True, indent=indent)
+            return response.model_dump_json(exclude_none=True, indent=indent)
         except Exception as e:
             logger.error(f"Failed to serialize response to JSON: {e}")
             error_response = ResponseSerializer.create_error_response(
                 "json_serialization_error",
                 f"Failed to serialize response to JSON: {e}"
             )
-            return error_response.json(exclude_none=True)
+            return error_response.model_dump_json(exclude_none=True)
 
     @staticmethod
     def validate_response_schema(response: Dict[str, Any], response_type: MCPResponseType) -> bool:
@@ -404,6 +414,7 @@ def process_qolaba_response(
 # Export main components
 __all__ = [
     "ResponseStatus",
+    "RESPONSE_STATUS_BY_VALUE",
     "MCPResponseType",
     "MCPResponseBase",
     "MCPTaskResponse",
@@ -32,10 +32,17 @@ T = TypeVar('T', bound=BaseModel)
 class ValidationResult:
     """Result of a validation operation."""
 
-    def __init__(self, success: bool, data: Optional[BaseModel] = None, error: Optional[str] = None):
+    def __init__(
+        self,
+        success: bool,
+        data: Optional[BaseModel] = None,
+        error: Optional[str] = None,
+        error_code: Optional[str] = None
+    ):
         self.success = success
         self.data = data
         self.error = error
+        self.error_code = error_code
 
 
 def validate_request_data(data: Dict[str, Any], model_class: Type[T]) -> ValidationResult:
@@ -70,6 +77,33 @@ def validate_request_data(data: Dict[str, Any], model_class: Type[T]) -> Validat
         return ValidationResult(success=False, error=error_msg)
 
 
+def _validation_error_response(message: Optional[str]) -> Dict[str, Any]:
+    """Build the MCP error payload for a validation failure message."""
+    return {
+        "success": False,
+        "error": "validation_error",
+        "message": message,
+        "details": "Please check your input parameters and try again."
+    }
+
+
+# Rejections detected before model construction, keyed by error code
+_KNOWN_VALIDATION_ERRORS = {
+    "message_empty": "Validation failed for ChatRequest: message cannot be empty",
+    "temperature_out_of_range": "Validation failed for ChatRequest: temperature must be between 0.0 and 2.0",
+    "max_tokens_out_of_range": "Validation failed for ChatRequest: max_tokens must be between 1 and 4000",
+    "chunk_size_out_of_range": "Validation failed for VectorStoreRequest: chunk_size must be between 100 and 4000",
+    "chunk_overlap_out_of_range": "Validation failed for VectorStoreRequest: chunk_overlap must be between 0 and 1000",
+    "chunk_overlap_too_large": "Validation failed for VectorStoreRequest: Chunk overlap must be less than chunk size",
+}
+
+# Their MCP error responses never change, so build them once
+_VALIDATION_ERROR_CACHE = {
+    code: _validation_error_response(message)
+    for code, message in _KNOWN_VALIDATION_ERRORS.items()
+}
+
+
 def format_validation_error(validation_result: ValidationResult) -> Dict[str, Any]:
     """
     Format validation error for MCP response.
@@ -80,12 +114,11 @@ def format_validation_error(validation_result: ValidationResult) -> Dict[str, An
     Returns:
         Standardized error response dictionary
     """
-    return {
-        "success": False,
-        "error": "validation_error",
-        "message": validation_result.error,
-        "details": "Please check your input parameters and try again."
-    }
+    if validation_result.error_code is not None:
+        cached = _VALIDATION_ERROR_CACHE.get(validation_result.error_code)
+        if cached is not None:
+            return dict(cached)
+    return _validation_error_response(validation_result.error)
 
 
 def validate_text_to_image_request(
@@ -109,7 +142,7 @@ def validate_text_to_image_request(
         "seed": seed,
         "negative_prompt": negative_prompt
     }
-    return validate_request_data(TextToImageRequest, data)
+    return validate_request_data(data, TextToImageRequest)
 
 
 def validate_image_to_image_request(
@@ -131,7 +164,7 @@ def validate_image_to_image_request(
         "guidance_scale": guidance_scale,
         "seed": seed
     }
-    return validate_request_data(ImageToImageRequest, data)
+    return validate_request_data(data, ImageToImageRequest)
 
 
 def validate_inpainting_request(
@@ -153,7 +186,7 @@ def validate_inpainting_request(
         "guidance_scale": guidance_scale,
         "seed": seed
     }
-    return validate_request_data(InpaintingRequest, data)
+    return validate_request_data(data, InpaintingRequest)
 
 
 def validate_replace_background_request(
@@ -173,7 +206,7 @@ def validate_replace_background_request(
         "guidance_scale": guidance_scale,
         "seed": seed
     }
-    return validate_request_data(ReplaceBackgroundRequest, data)
+    return validate_request_data(data, ReplaceBackgroundRequest)
 
 
 def validate_text_to_speech_request(
@@ -191,7 +224,19 @@ def validate_text_to_speech_request(
         "response_format": response_format,
         "speed": speed
     }
-    return validate_request_data(TextToSpeechRequest, data)
+    return validate_request_data(data, TextToSpeechRequest)
+
+
+def _out_of_range(value: Any, low: float, high: float) -> bool:
+    """Return True for a number that is clearly outside [low, high]."""
+    return isinstance(value, (int, float)) and not low <= value <= high
+
+
+def _known_error(error_code: str) -> ValidationResult:
+    """Build a failed result for a parameter rejected before model construction."""
+    error_msg = _KNOWN_VALIDATION_ERRORS[error_code]
+    logger.warning(error_msg)
+    return ValidationResult(success=False, error=error_msg, error_code=error_code)
 
 
 def validate_chat_request(
@@ -202,11 +247,21 @@ def validate_chat_request(
     system_message: Optional[str] = None
 ) -> ValidationResult:
     """Validate chat request parameters."""
+    # A blank prompt can never produce a useful completion
+    if isinstance(message, str) and (not message or message.isspace()):
+        return _known_error("message_empty")
+    # Cheap bounds checks first; the Pydantic model enforces the same limits
+    if _out_of_range(temperature, 0.0, 2.0):
+        return _known_error("temperature_out_of_range")
+    if max_tokens is not None and _out_of_range(max_tokens, 1, 4000):
+        return _known_error("max_tokens_out_of_range")
+
     # Build messages array
-    messages = []
-    if system_message:
-        messages.append({"role": "system", "content": system_message})
-    messages.append({"role": "user", "content": message})
+    user_message = {"role": "user", "content": message}
+    messages = (
+        [{"role": "system", "content": system_message}, user_message]
+        if system_message else [user_message]
+    )
 
     data = {
         "messages": messages,
@@ -214,7 +269,7 @@ def validate_chat_request(
         "max_tokens": max_tokens,
         "temperature": temperature
     }
-    return validate_request_data(ChatRequest, data)
+    return validate_request_data(data, ChatRequest)
 
 
 def validate_vector_store_request(
@@ -225,6 +280,15 @@ def validate_vector_store_request(
     chunk_overlap: int = 200
 ) -> ValidationResult:
     """Validate vector store request parameters."""
+    # Cheap bounds checks first; the Pydantic model enforces the same limits
+    if _out_of_range(chunk_size, 100, 4000):
+        return _known_error("chunk_size_out_of_range")
+    if _out_of_range(chunk_overlap, 0, 1000):
+        return _known_error("chunk_overlap_out_of_range")
+    if (isinstance(chunk_size, int) and isinstance(chunk_overlap, int)
+            and chunk_overlap >= chunk_size):
+        return _known_error("chunk_overlap_too_large")
+
     data = {
         "file": file_url,
         "collection_name": collection_name,
@@ -232,7 +296,7 @@ def validate_vector_store_request(
         "chunk_size": chunk_size,
         "chunk_overlap": chunk_overlap
     }
-    return validate_request_data(VectorStoreRequest, data)
+    return validate_request_data(data, VectorStoreRequest)
 
 
 def mcp_validate(validator_func):
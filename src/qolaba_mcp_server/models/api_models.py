@@ -7,9 +7,49 @@ All models include validation and serialization capabilities through Pydantic.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import base64
+import importlib
+import mmap
+import operator
+import os
+import random
+import re
+import unicodedata
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
 from pydantic import BaseModel, Field, validator
 
+try:
+    # Optional SIMD-accelerated base64 codec, used when pybase64 is installed
+    _pybase64: Optional[ModuleType] = importlib.import_module("pybase64")
+except ImportError:
+    _pybase64 = None
+
+try:
+    # Only needed to download images from URLs in convert_image_to_base64
+    requests: Optional[ModuleType] = importlib.import_module("requests")
+except ImportError:
+    requests = None
+
+
+# Anything the base64 codecs and image sniffing accept without copying
+_BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def _stdlib_b64encode_as_string(data: _BytesLike) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+_b64encode_as_string: Callable[[_BytesLike], str] = (
+    _pybase64.b64encode_as_string if _pybase64 is not None else _stdlib_b64encode_as_string
+)
+_b64decode: Callable[..., bytes] = (
+    _pybase64.b64decode if _pybase64 is not None else base64.b64decode
+)
+
 
 class BaseQolabaRequest(BaseModel):
     """Base class for all Qolaba API requests."""
@@ -113,11 +153,12 @@ class TextToSpeechRequest(BaseQolabaRequest):
 
     @validator("text")
     def validate_text(cls, v: str) -> str:
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Text cannot be empty")
-        if len(v) > 4000:
+        if len(stripped) > 4000:
             raise ValueError("Text too long (max 4000 characters)")
-        return v.strip()
+        return stripped
 
     @validator("voice")
     def validate_voice(cls, v: str) -> str:
@@ -182,6 +223,9 @@ class StreamChatRequest(ChatRequest):
 # Vector Database Models
 # =============================================================================
 
+_COLLECTION_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+
 class VectorStoreRequest(BaseQolabaRequest):
     """Request model for storing files in vector database."""
 
@@ -193,13 +237,13 @@ class VectorStoreRequest(BaseQolabaRequest):
 
     @validator("collection_name")
     def validate_collection_name(cls, v: str) -> str:
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Collection name cannot be empty")
         # Collection names should be alphanumeric with underscores/hyphens
-        import re
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _COLLECTION_NAME_RE.match(stripped):
             raise ValueError("Collection name can only contain letters, numbers, underscores, and hyphens")
-        return v.strip()
+        return stripped
 
     @validator("chunk_overlap")
     def validate_chunk_overlap(cls, v: int, values: Dict[str, Any]) -> int:
@@ -269,6 +313,27 @@ class ErrorSeverity:
     CRITICAL = "critical"
 
 
+# Ordered so validation messages list the values in declaration order
+_ALLOWED_ERROR_CATEGORIES = (
+    ErrorCategory.VALIDATION,
+    ErrorCategory.AUTHENTICATION,
+    ErrorCategory.AUTHORIZATION,
+    ErrorCategory.RATE_LIMIT,
+    ErrorCategory.API_ERROR,
+    ErrorCategory.NETWORK,
+    ErrorCategory.TIMEOUT,
+    ErrorCategory.SERVER_ERROR,
+    ErrorCategory.CLIENT_ERROR,
+    ErrorCategory.PROCESSING,
+)
+_ALLOWED_ERROR_SEVERITIES = (
+    ErrorSeverity.LOW,
+    ErrorSeverity.MEDIUM,
+    ErrorSeverity.HIGH,
+    ErrorSeverity.CRITICAL,
+)
+
+
 class DetailedQolabaError(BaseModel):
     """Enhanced error model with categorization and metadata."""
     
@@ -285,27 +350,14 @@ class DetailedQolabaError(BaseModel):
     
     @validator("category")
     def validate_category(cls, v):
-        allowed_categories = [
-            ErrorCategory.VALIDATION,
-            ErrorCategory.AUTHENTICATION,
-            ErrorCategory.AUTHORIZATION, 
-            ErrorCategory.RATE_LIMIT,
-            ErrorCategory.API_ERROR,
-            ErrorCategory.NETWORK,
-            ErrorCategory.TIMEOUT,
-            ErrorCategory.SERVER_ERROR,
-            ErrorCategory.CLIENT_ERROR,
-            ErrorCategory.PROCESSING
-        ]
-        if v not in allowed_categories:
-            raise ValueError(f"Category must be one of: {', '.join(allowed_categories)}")
+        if v not in _ALLOWED_ERROR_CATEGORIES:
+            raise ValueError(f"Category must be one of: {', '.join(_ALLOWED_ERROR_CATEGORIES)}")
         return v
     
     @validator("severity")
     def validate_severity(cls, v):
-        allowed_severities = [ErrorSeverity.LOW, ErrorSeverity.MEDIUM, ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]
-        if v not in allowed_severities:
-            raise ValueError(f"Severity must be one of: {', '.join(allowed_severities)}")
+        if v not in _ALLOWED_ERROR_SEVERITIES:
+            raise ValueError(f"Severity must be one of: {', '.join(_ALLOWED_ERROR_SEVERITIES)}")
         return v
     
     @validator("http_status")
@@ -336,6 +388,18 @@ class BatchErrorResponse(BaseModel):
 
 # Custom Exception Classes
 
+_TO_DICT_KEYS = (
+    "error_code",
+    "message",
+    "category",
+    "severity",
+    "http_status",
+    "details",
+    "request_id"
+)
+_TO_DICT_GETTER = operator.attrgetter(*_TO_DICT_KEYS)
+
+
 class QolabaException(Exception):
     """Base exception class for Qolaba API errors."""
     
@@ -353,19 +417,10 @@ class QolabaException(Exception):
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary."""
-        return {
-            "error_code": self.error_code,
-            "message": self.message,
-            "category": self.category,
-            "severity": self.severity,
-            "http_status": self.http_status,
-            "details": self.details,
-            "request_id": self.request_id
-        }
+        return dict(zip(_TO_DICT_KEYS, _TO_DICT_GETTER(self), strict=True))
         
     def to_detailed_error(self) -> DetailedQolabaError:
         """Convert exception to DetailedQolabaError model."""
-        from datetime import datetime
         return DetailedQolabaError(
             error_code=self.error_code,
             message=self.message,
@@ -593,7 +648,34 @@ def create_batch_error_response(total: int, errors: List[QolabaException]) -> Ba
     failed_count = len(errors)
     successful_count = total - failed_count
     
-    detailed_errors = [error.to_detailed_error() for error in errors]
+    # One shared timestamp per batch. QolabaException does not check its
+    # attributes, so only errors that pass DetailedQolabaError's category,
+    # severity and status validators skip full model validation; anything
+    # else goes through the validating constructor and raises as before.
+    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    detailed_errors = []
+    for error in errors:
+        fields: Dict[str, Any] = {
+            "error_code": error.error_code,
+            "message": error.message,
+            "category": error.category,
+            "severity": error.severity,
+            "http_status": error.http_status,
+            "details": error.details,
+            "request_id": error.request_id,
+            "timestamp": timestamp,
+        }
+        trusted = (
+            error.category in _ALLOWED_ERROR_CATEGORIES
+            and error.severity in _ALLOWED_ERROR_SEVERITIES
+            and isinstance(error.http_status, int)
+            and 100 <= error.http_status <= 599
+        )
+        detailed_errors.append(
+            DetailedQolabaError.model_construct(**fields)
+            if trusted
+            else DetailedQolabaError(**fields)
+        )
     
     return BatchErrorResponse(
         total_items=total,
@@ -666,16 +748,24 @@ def format_error_for_logging(error: QolabaException) -> Dict[str, Any]:
     Returns:
         Dictionary formatted for logging
     """
-    return {
-        "error_code": error.error_code,
-        "message": error.message,
-        "category": error.category,
-        "severity": error.severity,
-        "http_status": error.http_status,
-        "details": error.details,
-        "request_id": error.request_id,
-        "exception_type": type(error).__name__
-    }
+    return {**error.to_dict(), "exception_type": type(error).__name__}
+
+
+_RETRYABLE_CATEGORIES = frozenset({
+    ErrorCategory.NETWORK,
+    ErrorCategory.TIMEOUT,
+    ErrorCategory.RATE_LIMIT,
+    ErrorCategory.SERVER_ERROR
+})
+
+# Don't retry authentication/authorization errors
+_NON_RETRYABLE_CATEGORIES = frozenset({
+    ErrorCategory.AUTHENTICATION,
+    ErrorCategory.AUTHORIZATION,
+    ErrorCategory.VALIDATION
+})
+
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
 
 
 def is_retryable_error(error: QolabaException) -> bool:
@@ -688,31 +778,14 @@ def is_retryable_error(error: QolabaException) -> bool:
     Returns:
         True if error is retryable, False otherwise
     """
-    retryable_categories = [
-        ErrorCategory.NETWORK,
-        ErrorCategory.TIMEOUT,
-        ErrorCategory.RATE_LIMIT,
-        ErrorCategory.SERVER_ERROR
-    ]
-    
-    # Don't retry authentication/authorization errors
-    non_retryable_categories = [
-        ErrorCategory.AUTHENTICATION,
-        ErrorCategory.AUTHORIZATION,
-        ErrorCategory.VALIDATION
-    ]
-    
-    if error.category in non_retryable_categories:
+    if error.category in _NON_RETRYABLE_CATEGORIES:
         return False
     
-    if error.category in retryable_categories:
+    if error.category in _RETRYABLE_CATEGORIES:
         return True
     
     # Check HTTP status codes
-    if error.http_status in [408, 429, 500, 502, 503, 504]:
-        return True
-    
-    return False
+    return error.http_status in _RETRYABLE_STATUS
 
 
 def get_retry_delay(error: QolabaException, attempt: int = 1) -> float:
@@ -740,7 +813,6 @@ def get_retry_delay(error: QolabaException, attempt: int = 1) -> float:
     delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
     
     # Add jitter (±25%)
-    import random
     jitter_factor = 0.25
     jitter = random.uniform(-jitter_factor, jitter_factor)
     delay = delay * (1 + jitter)
@@ -775,6 +847,106 @@ class ChatResponse(BaseModel):
 # Utility Functions
 # =============================================================================
 
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+_SIZE_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$')
+# Every 3-digit hex color mapped to its normalized 6-digit form (4096 entries)
+_HEX3_TO_6 = {
+    r + g + b: f"#{r}{r}{g}{g}{b}{b}".upper()
+    for r in '0123456789abcdef'
+    for g in '0123456789abcdef'
+    for b in '0123456789abcdef'
+}
+_DURATION_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([smh]?)$')
+
+_AUDIO_FORMATS = {
+    'mp3': 'mp3',
+    'mpeg': 'mp3',
+    'opus': 'opus',
+    'ogg': 'opus',
+    'aac': 'aac',
+    'm4a': 'aac',
+    'flac': 'flac',
+    'wav': 'flac',  # Convert WAV to FLAC for API compatibility
+}
+
+_SIZE_MULTIPLIERS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024**2,
+    'GB': 1024**3,
+    'TB': 1024**4,
+    'K': 1024,
+    'M': 1024**2,
+    'G': 1024**3,
+    'T': 1024**4,
+    '': 1,  # No unit means bytes
+}
+
+_DURATION_MULTIPLIERS = {'s': 1, 'm': 60, 'h': 3600}
+
+_NAMED_COLORS = {
+    'red': '#FF0000',
+    'green': '#00FF00',
+    'blue': '#0000FF',
+    'white': '#FFFFFF',
+    'black': '#000000',
+    'yellow': '#FFFF00',
+    'cyan': '#00FFFF',
+    'magenta': '#FF00FF',
+    'orange': '#FFA500',
+    'purple': '#800080',
+    'pink': '#FFC0CB',
+    'brown': '#A52A2A',
+    'gray': '#808080',
+    'grey': '#808080',
+}
+
+_MODEL_MAPPINGS = {
+    'image': {
+        'flux': 'flux',
+        'flux-dev': 'flux',
+        'stable-diffusion': 'stable-diffusion',
+        'sd': 'stable-diffusion',
+        'dall-e': 'dalle',
+        'dalle': 'dalle',
+        'dalle-2': 'dalle',
+        'dalle-3': 'dalle-3',
+    },
+    'chat': {
+        'gpt-4': 'gpt-4',
+        'gpt-4o': 'gpt-4o',
+        'gpt-3.5': 'gpt-3.5-turbo',
+        'gpt-3.5-turbo': 'gpt-3.5-turbo',
+        'claude': 'claude-3-opus',
+        'claude-3': 'claude-3-opus',
+        'claude-opus': 'claude-3-opus',
+        'llama': 'llama-2-70b',
+        'llama-2': 'llama-2-70b',
+    },
+    'audio': {
+        'tts-1': 'tts-1',
+        'tts-2': 'tts-1-hd',
+        'tts-1-hd': 'tts-1-hd',
+        'whisper': 'whisper-1',
+        'whisper-1': 'whisper-1',
+    },
+    'vector': {
+        'text-embedding-ada': 'text-embedding-ada-002',
+        'ada': 'text-embedding-ada-002',
+        'embedding': 'text-embedding-ada-002',
+    }
+}
+
+
 def validate_image_data(image_data: str) -> bool:
     """
     Validate that image data is either a valid URL or base64 encoded image.
@@ -785,31 +957,16 @@ def validate_image_data(image_data: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
-
-    # Check if it's a URL
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-    if url_pattern.match(image_data):
-        return True
+    # Check if it's a URL (only run the regex on inputs that look like one)
+    if image_data[:8].lower().startswith(('http://', 'https://')):
+        return _URL_RE.match(image_data) is not None
 
     # Check if it's base64 data
     if image_data.startswith('data:image/'):
         return True
 
-    # Check if it's raw base64
-    try:
-        import base64
-        base64.b64decode(image_data, validate=True)
-        return True
-    except Exception:
-        return False
+    # Check if it's raw base64 without decoding the whole payload
+    return len(image_data) % 4 == 0 and _BASE64_RE.fullmatch(image_data) is not None
 
 
 def sanitize_filename(filename: str) -> str:
@@ -822,9 +979,6 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
-    import unicodedata
-
     # Normalize unicode characters
     filename = unicodedata.normalize('NFKD', filename)
 
@@ -843,6 +997,58 @@ def sanitize_filename(filename: str) -> str:
 # Advanced Data Type Conversion and Validation Utilities
 # =============================================================================
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+_MAX_PATH_LENGTH = 4096  # PATH_MAX on Linux; anything longer is a payload
+
+
+def _read_download_body(response: Any) -> bytearray:
+    """
+    Read a streamed ``requests`` response body into a single buffer.
+
+    When the server announces the (uncompressed) body size, the buffer is
+    allocated once and filled in place with ``readinto``; otherwise large
+    chunks are appended as they arrive.
+    """
+    content_length = int(response.headers.get('Content-Length') or 0)
+    if content_length and not response.headers.get('Content-Encoding'):
+        buffer = bytearray(content_length)
+        with memoryview(buffer) as view:
+            received = 0
+            while received < content_length:
+                read = response.raw.readinto(view[received:received + _DOWNLOAD_CHUNK_SIZE])
+                if not read:
+                    break
+                received += read
+        del buffer[received:]
+        return buffer
+
+    buffer = bytearray()
+    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+        buffer += chunk
+    return buffer
+
+
+def _detect_image_mime_type(image_data: _BytesLike) -> str:
+    """
+    Detect the image MIME type from its magic bytes (simple detection).
+
+    The first 8 bytes are loaded as one big-endian integer so the signature
+    checks are plain integer compares instead of repeated startswith calls.
+    """
+    head = bytes(memoryview(image_data)[:12])
+    h8 = int.from_bytes(head[:8].ljust(8, b'\x00'), 'big')
+
+    if h8 >> 40 == 0xFFD8FF:
+        return 'image/jpeg'
+    if h8 == 0x89504E470D0A1A0A:  # \x89PNG\r\n\x1a\n
+        return 'image/png'
+    if h8 >> 16 in (0x474946383761, 0x474946383961):  # GIF87a / GIF89a
+        return 'image/gif'
+    if head[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'  # Default fallback
+
+
 def convert_image_to_base64(image_input: Union[str, bytes]) -> str:
     """
     Convert various image input formats to base64 string.
@@ -856,11 +1062,8 @@ def convert_image_to_base64(image_input: Union[str, bytes]) -> str:
     Raises:
         ValueError: If image conversion fails
     """
-    import base64
-    import requests
-    from pathlib import Path
-    from typing import BinaryIO
-    
+    # Downloads are read into a preallocated bytearray; other inputs stay bytes
+    image_data: Union[bytes, bytearray]
     try:
         if isinstance(image_input, bytes):
             # Direct bytes conversion
@@ -868,36 +1071,35 @@ def convert_image_to_base64(image_input: Union[str, bytes]) -> str:
         elif isinstance(image_input, str):
             if image_input.startswith(('http://', 'https://')):
                 # URL - download image
-                response = requests.get(image_input, timeout=30)
-                response.raise_for_status()
-                image_data = response.content
+                if requests is None:
+                    raise ValueError("the 'requests' package is required to download images")
+                with requests.get(image_input, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    image_data = _read_download_body(response)
             elif image_input.startswith('data:image/'):
                 # Already base64 data URI
                 return image_input
-            elif Path(image_input).exists():
-                # File path
+            elif (len(image_input) <= _MAX_PATH_LENGTH
+                  and '\n' not in image_input
+                  and os.path.exists(image_input)):
+                # File path (long or wrapped inputs are base64 payloads, skip the stat)
                 with open(image_input, 'rb') as f:
-                    image_data = f.read()
+                    if os.fstat(f.fileno()).st_size:
+                        # Encode straight from the page cache instead of copying into bytes
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            mime_type = _detect_image_mime_type(mm)
+                            return f"data:{mime_type};base64,{_b64encode_as_string(mm)}"
+                    image_data = b''
             else:
                 # Try as base64 string
-                image_data = base64.b64decode(image_input)
+                image_data = _b64decode(image_input, validate=False)
         else:
             raise ValueError(f"Unsupported image input type: {type(image_input)}")
             
         # Convert to base64 with data URI
-        b64_string = base64.b64encode(image_data).decode('utf-8')
+        b64_string = _b64encode_as_string(image_data)
         
-        # Detect image format (simple detection)
-        if image_data.startswith(b'\xFF\xD8\xFF'):
-            mime_type = 'image/jpeg'
-        elif image_data.startswith(b'\x89PNG\r\n\x1a\n'):
-            mime_type = 'image/png'
-        elif image_data.startswith(b'GIF87a') or image_data.startswith(b'GIF89a'):
-            mime_type = 'image/gif'
-        elif image_data.startswith(b'WEBP', 8):
-            mime_type = 'image/webp'
-        else:
-            mime_type = 'image/jpeg'  # Default fallback
+        mime_type = _detect_image_mime_type(image_data)
             
         return f"data:{mime_type};base64,{b64_string}"
         
@@ -905,6 +1107,7 @@ def convert_image_to_base64(image_input: Union[str, bytes]) -> str:
         raise ValueError(f"Failed to convert image to base64: {str(e)}")
 
 
+@lru_cache(maxsize=256)
 def validate_audio_format(format_type: str) -> str:
     """
     Validate and normalize audio format.
@@ -918,23 +1121,12 @@ def validate_audio_format(format_type: str) -> str:
     Raises:
         ValueError: If format is not supported
     """
-    format_mapping = {
-        'mp3': 'mp3',
-        'mpeg': 'mp3',
-        'opus': 'opus',
-        'ogg': 'opus',
-        'aac': 'aac',
-        'm4a': 'aac',
-        'flac': 'flac',
-        'wav': 'flac',  # Convert WAV to FLAC for API compatibility
-    }
-    
     format_lower = format_type.lower()
-    if format_lower not in format_mapping:
-        supported = ', '.join(format_mapping.keys())
+    if format_lower not in _AUDIO_FORMATS:
+        supported = ', '.join(_AUDIO_FORMATS.keys())
         raise ValueError(f"Unsupported audio format '{format_type}'. Supported: {supported}")
     
-    return format_mapping[format_lower]
+    return _AUDIO_FORMATS[format_lower]
 
 
 def convert_file_size_to_bytes(size_str: str) -> int:
@@ -950,14 +1142,11 @@ def convert_file_size_to_bytes(size_str: str) -> int:
     Raises:
         ValueError: If size string is invalid
     """
-    import re
-    
     if isinstance(size_str, (int, float)):
         return int(size_str)
     
     # Parse size string
-    pattern = r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$'
-    match = re.match(pattern, size_str.upper().strip())
+    match = _SIZE_RE.match(size_str.upper().strip())
     
     if not match:
         raise ValueError(f"Invalid size format: {size_str}")
@@ -965,20 +1154,29 @@ def convert_file_size_to_bytes(size_str: str) -> int:
     size_value = float(match.group(1))
     unit = match.group(2)
     
-    multipliers = {
-        'B': 1,
-        'KB': 1024,
-        'MB': 1024**2,
-        'GB': 1024**3,
-        'TB': 1024**4,
-        'K': 1024,
-        'M': 1024**2,
-        'G': 1024**3,
-        'T': 1024**4,
-        '': 1,  # No unit means bytes
-    }
+    return int(size_value * _SIZE_MULTIPLIERS.get(unit, 1))
+
+
+@lru_cache(maxsize=256)
+def _normalize_color_string(color: str) -> Optional[str]:
+    """Normalize a lowercased, stripped color string, or return None if invalid."""
+    # Check named colors
+    if color in _NAMED_COLORS:
+        return _NAMED_COLORS[color]
+    
+    # Check hex format (with or without leading '#')
+    hex_digits = color[1:] if color[:1] == '#' else color
+    if len(hex_digits) == 6:
+        try:
+            # fromhex skips whitespace between pairs, so insist on three bytes
+            if len(bytes.fromhex(hex_digits)) == 3:
+                return '#' + hex_digits.upper()
+        except ValueError:
+            pass
+        return None
     
-    return int(size_value * multipliers.get(unit, 1))
+    # Convert 3-digit hex to 6-digit
+    return _HEX3_TO_6.get(hex_digits)
 
 
 def validate_color_value(color: Union[str, tuple, list]) -> str:
@@ -994,58 +1192,23 @@ def validate_color_value(color: Union[str, tuple, list]) -> str:
     Raises:
         ValueError: If color format is invalid
     """
-    import re
-    
-    # Named colors mapping
-    named_colors = {
-        'red': '#FF0000',
-        'green': '#00FF00',
-        'blue': '#0000FF',
-        'white': '#FFFFFF',
-        'black': '#000000',
-        'yellow': '#FFFF00',
-        'cyan': '#00FFFF',
-        'magenta': '#FF00FF',
-        'orange': '#FFA500',
-        'purple': '#800080',
-        'pink': '#FFC0CB',
-        'brown': '#A52A2A',
-        'gray': '#808080',
-        'grey': '#808080',
-    }
-    
     if isinstance(color, str):
         color = color.lower().strip()
-        
-        # Check named colors
-        if color in named_colors:
-            return named_colors[color]
-        
-        # Check hex format
-        if re.match(r'^#[0-9a-f]{6}$', color):
-            return color.upper()
-        elif re.match(r'^#[0-9a-f]{3}$', color):
-            # Convert 3-digit hex to 6-digit
-            return f"#{color[1]*2}{color[2]*2}{color[3]*2}".upper()
-        elif re.match(r'^[0-9a-f]{6}$', color):
-            return f"#{color}".upper()
-        elif re.match(r'^[0-9a-f]{3}$', color):
-            return f"#{color[0]*2}{color[1]*2}{color[2]*2}".upper()
-    
-    elif isinstance(color, (tuple, list)):
-        if len(color) == 3:
-            r, g, b = color
-            if all(0 <= c <= 255 for c in [r, g, b]):
-                return f"#{int(r):02X}{int(g):02X}{int(b):02X}"
-        elif len(color) == 4:
-            # RGBA - ignore alpha for now
-            r, g, b, a = color
-            if all(0 <= c <= 255 for c in [r, g, b]) and 0 <= a <= 1:
-                return f"#{int(r):02X}{int(g):02X}{int(b):02X}"
+        normalized = _normalize_color_string(color)
+        if normalized is not None:
+            return normalized
+    
+    elif isinstance(color, (tuple, list)) and len(color) in (3, 4):
+        r, g, b = color[:3]
+        # RGBA - ignore alpha for now, but it must still be in range
+        if (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255
+                and (len(color) == 3 or 0 <= color[3] <= 1)):
+            return "#" + bytes((int(r), int(g), int(b))).hex().upper()
     
     raise ValueError(f"Invalid color format: {color}")
 
 
+@lru_cache(maxsize=256)
 def normalize_model_name(model_name: str, api_type: str) -> str:
     """
     Normalize model names for different API endpoints.
@@ -1060,44 +1223,8 @@ def normalize_model_name(model_name: str, api_type: str) -> str:
     Raises:
         ValueError: If model is not supported for the API type
     """
-    model_mappings = {
-        'image': {
-            'flux': 'flux',
-            'flux-dev': 'flux',
-            'stable-diffusion': 'stable-diffusion',
-            'sd': 'stable-diffusion',
-            'dall-e': 'dalle',
-            'dalle': 'dalle',
-            'dalle-2': 'dalle',
-            'dalle-3': 'dalle-3',
-        },
-        'chat': {
-            'gpt-4': 'gpt-4',
-            'gpt-4o': 'gpt-4o',
-            'gpt-3.5': 'gpt-3.5-turbo',
-            'gpt-3.5-turbo': 'gpt-3.5-turbo',
-            'claude': 'claude-3-opus',
-            'claude-3': 'claude-3-opus',
-            'claude-opus': 'claude-3-opus',
-            'llama': 'llama-2-70b',
-            'llama-2': 'llama-2-70b',
-        },
-        'audio': {
-            'tts-1': 'tts-1',
-            'tts-2': 'tts-1-hd',
-            'tts-1-hd': 'tts-1-hd',
-            'whisper': 'whisper-1',
-            'whisper-1': 'whisper-1',
-        },
-        'vector': {
-            'text-embedding-ada': 'text-embedding-ada-002',
-            'ada': 'text-embedding-ada-002',
-            'embedding': 'text-embedding-ada-002',
-        }
-    }
-    
     model_lower = model_name.lower().strip()
-    api_models = model_mappings.get(api_type, {})
+    api_models = _MODEL_MAPPINGS.get(api_type, {})
     
     if model_lower in api_models:
         return api_models[model_lower]
@@ -1106,13 +1233,19 @@ def normalize_model_name(model_name: str, api_type: str) -> str:
     return model_lower
 
 
-def validate_url_or_path(input_value: str, allow_local: bool = False) -> str:
+def validate_url_or_path(
+    input_value: str,
+    allow_local: bool = False,
+    resolve_symlinks: bool = False
+) -> str:
     """
     Validate URL or file path.
     
     Args:
         input_value: URL or file path to validate
         allow_local: Whether to allow local file paths
+        resolve_symlinks: Whether to resolve symlinks in local paths
+            (otherwise the path is only made absolute)
         
     Returns:
         Validated URL or path
@@ -1120,42 +1253,29 @@ def validate_url_or_path(input_value: str, allow_local: bool = False) -> str:
     Raises:
         ValueError: If URL/path is invalid
     """
-    import re
-    from pathlib import Path
-    from urllib.parse import urlparse
-    
     if not input_value or not input_value.strip():
         raise ValueError("URL or path cannot be empty")
     
     input_value = input_value.strip()
     
     # Check if it's a URL
-    url_pattern = re.compile(
-        r'^https?://'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-        r'localhost|'
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-        r'(?::\d+)?'
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    if url_pattern.match(input_value):
-        # Validate URL structure
-        try:
-            parsed = urlparse(input_value)
-            if not all([parsed.scheme, parsed.netloc]):
-                raise ValueError("Invalid URL structure")
-            return input_value
-        except Exception:
+    try:
+        parsed = urlparse(input_value)
+    except ValueError:
+        raise ValueError(f"Invalid URL: {input_value}")
+    if parsed.scheme in ('http', 'https'):
+        if not parsed.netloc:
             raise ValueError(f"Invalid URL: {input_value}")
+        return input_value
     
     # Check if it's a local path
     if allow_local:
         try:
-            path = Path(input_value)
-            if path.exists():
-                return str(path.resolve())
-            else:
-                raise ValueError(f"File not found: {input_value}")
+            if os.path.exists(input_value):
+                if resolve_symlinks:
+                    return os.path.realpath(input_value)
+                return os.path.abspath(input_value)
+            raise ValueError(f"File not found: {input_value}")
         except Exception as e:
             raise ValueError(f"Invalid file path: {input_value} - {str(e)}")
     
@@ -1194,14 +1314,12 @@ def convert_duration_to_seconds(duration: Union[str, int, float]) -> float:
             return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
     
     # Format with units (90s, 1.5m, 2h)
-    import re
-    match = re.match(r'^(\d+(?:\.\d+)?)\s*([smh]?)$', duration)
+    match = _DURATION_RE.match(duration)
     if match:
         value = float(match.group(1))
         unit = match.group(2) or 's'  # Default to seconds
         
-        multipliers = {'s': 1, 'm': 60, 'h': 3600}
-        return value * multipliers[unit]
+        return value * _DURATION_MULTIPLIERS[unit]
     
     raise ValueError(f"Invalid duration format: {duration}")
 
@@ -1223,15 +1341,10 @@ def validate_json_schema(data: Dict[str, Any], required_fields: List[str] = None
     if not isinstance(data, dict):
         raise ValueError("Data must be a dictionary")
     
-    if required_fields:
+    if required_fields and not all(field in data for field in required_fields):
+        # Only build the list of missing fields when we are about to raise
         missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
-            raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
     
     # Remove None values and empty strings
-    cleaned_data = {}
-    for key, value in data.items():
-        if value is not None and value != '':
-            cleaned_data[key] = value
-    
-    return cleaned_data
\ No newline at end of file
+    return {key: value for key, value in data.items() if value is not None and value != ''}
\ No newline at end of file
@@ -16,8 +16,20 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
+
+from pydantic import BaseModel
 
 from fastmcp import FastMCP
 from fastmcp.server.context import Context
@@ -49,6 +61,7 @@ from qolaba_mcp_server.mcp.validation import (
 from qolaba_mcp_server.mcp.responses import (
     ResponseSerializer,
     ResponseStatus,
+    RESPONSE_STATUS_BY_VALUE,
     MCPResponseType,
     process_qolaba_response
 )
@@ -64,6 +77,113 @@ logger = logging.getLogger(__name__)
 # Initialize settings and MCP server
 settings = get_settings()
 
+# Shared HTTP client so tool calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake per request.
+_client: Optional[QolabaHTTPClient] = None
+_client_lock = asyncio.Lock()
+
+# Bound concurrent upstream calls so load spikes queue here instead of
+# exhausting sockets. The HTTP pool is sized to the sum of both budgets, so
+# status polls always have connections left even while every generation
+# and chat slot is busy.
+_UPSTREAM_SEMAPHORE = asyncio.Semaphore(settings.max_concurrency)
+_STATUS_SEMAPHORE = asyncio.Semaphore(settings.max_status_concurrency)
+
+
+async def _get_client() -> QolabaHTTPClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                client = QolabaHTTPClient()
+                await client._ensure_client()
+                _client = client
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it has been created."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.close()
+
+
+_serialize = ResponseSerializer.serialize_to_dict
+
+# The fallback error only differs per call by its timestamp, so serialize it once
+_UNEXPECTED_FORMAT_ERROR = _serialize(
+    ResponseSerializer.create_error_response(
+        "unexpected_response_format",
+        "Received unexpected response format from API"
+    )
+)
+
+
+def _dispatch(response: HTTPResponse, operation_type: str) -> Dict[str, Any]:
+    """Turn an API response into the serialized MCP response for a tool."""
+    content = response.content
+    if isinstance(content, dict):
+        return _serialize(process_qolaba_response(
+            content,
+            operation_type,
+            request_id=response.headers.get("x-request-id")
+        ))
+
+    # Fallback for unexpected response format
+    return {**_UNEXPECTED_FORMAT_ERROR, "timestamp": datetime.utcnow()}
+
+
+def _dump_request(model: BaseModel) -> bytes:
+    """Serialize a validated request model straight to a JSON body."""
+    return model.model_dump_json(exclude_none=True).encode()
+
+
+class _ResponseCache:
+    """Small LRU cache of serialized tool responses with per-entry expiry.
+
+    Responses are deep-copied in and out, so callers never share nested
+    objects with each other or with the cached entry.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of the cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(payload)
+
+    def put(self, key: str, payload: Dict[str, Any], ttl: float) -> None:
+        """Store a deep copy of a response, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(payload))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled connections when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 mcp = FastMCP(
     name="Qolaba API MCP Server",
     instructions="""
@@ -86,6 +206,7 @@ mcp = FastMCP(
 
     All operations are asynchronous and may require polling for completion.
     """,
+    lifespan=_lifespan,
 )
 
 
@@ -134,44 +255,33 @@ async def text_to_image(
     )
 
     if not validation_result.success:
-        logger.warning(f"Text-to-image validation failed: {validation_result.error}")
+        logger.warning("Text-to-image validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
 
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
+
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "text-to-image",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Text-to-image request submitted: {response.status_code}")
+        logger.info("Text-to-image request submitted: %s", response.status_code)
 
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "text_to_image",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
-            else:
-                # Fallback for unexpected response format
-                return ResponseSerializer.serialize_to_dict(
-                    ResponseSerializer.create_error_response(
-                        "unexpected_response_format",
-                        "Received unexpected response format from API"
-                    )
-                )
+        return _dispatch(response, "text_to_image")
 
     except HTTPClientError as e:
-        logger.error(f"Text-to-image request failed: {e}")
+        logger.error("Text-to-image request failed: %s", e)
         error_response = ResponseSerializer.create_error_response(
             "api_error",
             str(e),
-            error_details={"status_code": getattr(e, "status_code", None)}
+            error_details={"status_code": e.status_code}
         )
         return ResponseSerializer.serialize_to_dict(error_response)
 
@@ -214,45 +324,34 @@ async def image_to_image(
     )
 
     if not validation_result.success:
-        logger.warning(f"Image-to-image validation failed: {validation_result.error}")
+        logger.warning("Image-to-image validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
+
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
 
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "image-to-image",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Image-to-image request submitted: {response.status_code}")
-
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "image_to_image",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
+        logger.info("Image-to-image request submitted: %s", response.status_code)
 
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "image_to_image")
 
     except HTTPClientError as e:
-        logger.error(f"Image-to-image request failed: {e}")
+        logger.error("Image-to-image request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Image-to-image request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -287,7 +386,8 @@ async def inpainting(
     Returns:
         Dict containing task_id and status information for polling
     """
-    logger.info(f"Processing inpainting request: {prompt[:50]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing inpainting request: %s...", prompt[:50])
 
     # Validate request using MCP validation
     validation_result = validate_inpainting_request(
@@ -301,45 +401,34 @@ async def inpainting(
     )
 
     if not validation_result.success:
-        logger.warning(f"Inpainting validation failed: {validation_result.error}")
+        logger.warning("Inpainting validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
 
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
+
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "inpainting",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Inpainting request submitted: {response.status_code}")
-
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "inpainting",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
+        logger.info("Inpainting request submitted: %s", response.status_code)
 
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "inpainting")
 
     except HTTPClientError as e:
-        logger.error(f"Inpainting request failed: {e}")
+        logger.error("Inpainting request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Inpainting request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -368,7 +457,8 @@ async def replace_background(
     Returns:
         Dict containing task_id and status information for polling
     """
-    logger.info(f"Processing replace background request: {prompt[:50]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing replace background request: %s...", prompt[:50])
 
     # Validate request using MCP validation
     validation_result = validate_replace_background_request(
@@ -381,45 +471,34 @@ async def replace_background(
     )
 
     if not validation_result.success:
-        logger.warning(f"Replace background validation failed: {validation_result.error}")
+        logger.warning("Replace background validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
+
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
 
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "replace-background",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Background replacement request submitted: {response.status_code}")
+        logger.info("Background replacement request submitted: %s", response.status_code)
 
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "replace_background",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
-
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "replace_background")
 
     except HTTPClientError as e:
-        logger.error(f"Background replacement request failed: {e}")
+        logger.error("Background replacement request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Background replacement request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -460,45 +539,34 @@ async def text_to_speech(
     )
 
     if not validation_result.success:
-        logger.warning(f"Text-to-speech validation failed: {validation_result.error}")
+        logger.warning("Text-to-speech validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
 
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
+
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "text-to-speech",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Text-to-speech request submitted: {response.status_code}")
+        logger.info("Text-to-speech request submitted: %s", response.status_code)
 
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "text_to_speech",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
-
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "text_to_speech")
 
     except HTTPClientError as e:
-        logger.error(f"Text-to-speech request failed: {e}")
+        logger.error("Text-to-speech request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Text-to-speech request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -507,6 +575,22 @@ async def text_to_speech(
 # Chat and Conversation Tools
 # =============================================================================
 
+# Replies to identical chat requests, keyed by a hash of the request body.
+# Locks are held weakly so they disappear once no caller is waiting on them.
+_CHAT_CACHE = _ResponseCache(max_size=1024)
+_CHAT_CACHE_TTL = 600.0
+_chat_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _default_chat_body(message: str) -> bytes:
+    """Serialize a default-parameter chat request exactly as ChatRequest would."""
+    return json.dumps(
+        {"messages": [{"role": "user", "content": message}], "model": "gpt-4", "temperature": 0.7},
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode()
+
+
 @mcp.tool("chat")
 async def chat(
     ctx: Context,
@@ -514,77 +598,99 @@ async def chat(
     model: str = "gpt-4",
     max_tokens: Optional[int] = None,
     temperature: float = 0.7,
-    system_message: Optional[str] = None
+    system_message: Optional[str] = None,
+    cache_response: bool = False
 ) -> Dict[str, Any]:
     """
     Send a chat message and get a response from Qolaba's chat API.
 
+    Identical requests with temperature 0 are answered from a short-lived
+    cache, and concurrent duplicates share a single upstream call.
+
     Args:
         message: The message to send to the AI
         model: The chat model to use (default: "gpt-4")
         max_tokens: Maximum tokens in response (optional)
         temperature: Response creativity (0.0-2.0, default: 0.7)
         system_message: System prompt to set behavior (optional)
+        cache_response: Also cache replies when temperature is above 0 (default: False)
 
     Returns:
         Dict containing the AI response and metadata
     """
-    logger.info(f"Processing chat request: {message[:50]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing chat request: %s...", message[:50])
+
+    if (
+        system_message is None and model == "gpt-4" and max_tokens is None
+        and temperature == 0.7 and isinstance(message, str)
+        and message and not message.isspace()
+    ):
+        # Default parameters always validate, so skip building the model
+        body = _default_chat_body(message)
+    else:
+        # Validate request using MCP validation (builds the messages list)
+        validation_result = validate_chat_request(
+            message=message,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_message=system_message
+        )
 
-    # Build messages list
-    messages = []
-    if system_message:
-        messages.append({"role": "system", "content": system_message})
-    messages.append({"role": "user", "content": message})
+        if not validation_result.success:
+            logger.warning("Chat validation failed: %s", validation_result.error)
+            return format_validation_error(validation_result)
 
-    # Validate request using MCP validation
-    validation_result = validate_chat_request(
-        messages=messages,
-        model=model,
-        max_tokens=max_tokens,
-        temperature=temperature
-    )
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
+        body = _dump_request(validated_request)
 
-    if not validation_result.success:
-        logger.warning(f"Chat validation failed: {validation_result.error}")
-        return format_validation_error(validation_result)
+    if not (cache_response or temperature == 0):
+        return await _send_chat(body)
+
+    key = hashlib.blake2b(body, digest_size=16).hexdigest()
+    lock = _chat_locks.get(key)
+    if lock is None:
+        lock = _chat_locks[key] = asyncio.Lock()
+
+    # Concurrent duplicates wait here and then find the first caller's reply
+    async with lock:
+        cached = _CHAT_CACHE.get(key)
+        if cached is not None:
+            logger.info("Chat request served from cache")
+            return cached
 
+        result = await _send_chat(body)
+        if result.get("success"):
+            _CHAT_CACHE.put(key, result, _CHAT_CACHE_TTL)
+        return result
+
+
+async def _send_chat(body: bytes) -> Dict[str, Any]:
+    """Post a serialized chat request and return the serialized MCP response."""
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
 
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "chat",
-                json=validated_request.dict(exclude_none=True)
+                content=body,
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Chat request completed: {response.status_code}")
-
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "chat",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
+        logger.info("Chat request completed: %s", response.status_code)
 
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "chat")
 
     except HTTPClientError as e:
-        logger.error(f"Chat request failed: {e}")
+        logger.error("Chat request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Chat request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -615,7 +721,7 @@ async def store_file_in_vector_db(
     Returns:
         Dict containing task_id and status information for polling
     """
-    logger.info(f"Processing vector store request: {collection_name}")
+    logger.info("Processing vector store request: %s", collection_name)
 
     # Validate request using MCP validation
     validation_result = validate_vector_store_request(
@@ -627,45 +733,34 @@ async def store_file_in_vector_db(
     )
 
     if not validation_result.success:
-        logger.warning(f"Vector store validation failed: {validation_result.error}")
+        logger.warning("Vector store validation failed: %s", validation_result.error)
         return format_validation_error(validation_result)
 
     try:
-        async with QolabaHTTPClient() as client:
-            # Use the validated model for the API request
-            validated_request = validation_result.data
+        client = await _get_client()
 
+        # Use the validated model for the API request
+        validated_request = validation_result.data
+        assert validated_request is not None  # guaranteed by validation_result.success
+
+        async with _UPSTREAM_SEMAPHORE:
             response = await client.post(
                 "store-file-in-vector-database",
-                json=validated_request.dict(exclude_none=True)
+                content=_dump_request(validated_request),
+                headers={"Content-Type": "application/json"}
             )
 
-            logger.info(f"Vector store request submitted: {response.status_code}")
+        logger.info("Vector store request submitted: %s", response.status_code)
 
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                mcp_response = process_qolaba_response(
-                    response.content,
-                    "store_file_in_vector_db",
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
-
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
-            )
+        return _dispatch(response, "store_file_in_vector_db")
 
     except HTTPClientError as e:
-        logger.error(f"Vector store request failed: {e}")
+        logger.error("Vector store request failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Vector store request failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -674,6 +769,19 @@ async def store_file_in_vector_db(
 # Task Management Tools
 # =============================================================================
 
+# Finished tasks never change, so repeat polls are answered locally; in-flight
+# statuses are only kept briefly to absorb bursts of concurrent polling.
+_TASK_CACHE = _ResponseCache(max_size=1024)
+_TERMINAL_TASK_TTL = 3600.0
+_PENDING_TASK_TTL = 0.25
+_TERMINAL_TASK_STATUSES = frozenset(
+    {ResponseStatus.COMPLETED, ResponseStatus.FAILED, ResponseStatus.CANCELLED}
+)
+# Outstanding lookups by task id, so concurrent polls for the same task share
+# a single upstream request.
+_task_status_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
 @mcp.tool("get_task_status")
 async def get_task_status(
     ctx: Context,
@@ -688,44 +796,68 @@ async def get_task_status(
     Returns:
         Dict containing task status, progress, and results if completed
     """
-    logger.info(f"Checking task status: {task_id}")
+    logger.info("Checking task status: %s", task_id)
+
+    cached = _TASK_CACHE.get(task_id)
+    if cached is not None:
+        return cached
+
+    inflight = _task_status_inflight.get(task_id)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_fetch_task_status(task_id))
+        _task_status_inflight[task_id] = inflight
+        inflight.add_done_callback(lambda _: _task_status_inflight.pop(task_id, None))
 
+    # Shielded so one caller being cancelled does not cancel the shared lookup;
+    # every caller gets its own copy of the shared result
+    return copy.deepcopy(await asyncio.shield(inflight))
+
+
+async def _fetch_task_status(task_id: str) -> Dict[str, Any]:
+    """Fetch a task status from the API and cache it according to its state."""
     try:
-        async with QolabaHTTPClient() as client:
+        client = await _get_client()
+
+        async with _STATUS_SEMAPHORE:
             response = await client.get(f"task-status/{task_id}")
 
-            logger.info(f"Task status checked: {task_id}")
-
-            # Process response using the new serialization system
-            if isinstance(response.content, dict):
-                # Create task status response from API data
-                mcp_response = ResponseSerializer.create_task_status_response(
-                    task_id=task_id,
-                    status=ResponseStatus(response.content.get("status", "pending")),
-                    progress=float(response.content.get("progress", 0.0)),
-                    result=response.content.get("result"),
-                    error_details=response.content.get("error"),
-                    created_at=response.content.get("created_at"),
-                    updated_at=response.content.get("updated_at"),
-                    request_id=response.headers.get("x-request-id")
-                )
-                return ResponseSerializer.serialize_to_dict(mcp_response)
+        logger.info("Task status checked: %s", task_id)
 
-            # Fallback for unexpected response format
-            return ResponseSerializer.serialize_to_dict(
-                ResponseSerializer.create_error_response(
-                    "unexpected_response_format",
-                    "Received unexpected response format from API"
-                )
+        # Process response using the new serialization system
+        if isinstance(response.content, dict):
+            # Create task status response from API data. Unknown upstream
+            # statuses are reported as pending, and so only cached briefly.
+            status = RESPONSE_STATUS_BY_VALUE.get(
+                response.content.get("status", "pending"), ResponseStatus.PENDING
+            )
+            mcp_response = ResponseSerializer.create_task_status_response(
+                task_id=task_id,
+                status=status,
+                progress=float(response.content.get("progress", 0.0)),
+                result=response.content.get("result"),
+                error_details=response.content.get("error"),
+                created_at=response.content.get("created_at"),
+                updated_at=response.content.get("updated_at"),
+                request_id=response.headers.get("x-request-id")
             )
+            result = ResponseSerializer.serialize_to_dict(mcp_response)
+            _TASK_CACHE.put(
+                task_id,
+                result,
+                _TERMINAL_TASK_TTL if status in _TERMINAL_TASK_STATUSES else _PENDING_TASK_TTL
+            )
+            return result
+
+        # Fallback for unexpected response format
+        return {**_UNEXPECTED_FORMAT_ERROR, "timestamp": datetime.utcnow()}
 
     except HTTPClientError as e:
-        logger.error(f"Task status check failed: {e}")
+        logger.error("Task status check failed: %s", e)
         return ResponseSerializer.serialize_to_dict(
             ResponseSerializer.create_error_response(
                 "api_client_error",
                 f"Task status check failed: {e}",
-                error_details={"status_code": getattr(e, "status_code", None)}
+                error_details={"status_code": e.status_code}
             )
         )
 
@@ -734,16 +866,9 @@ async def get_task_status(
 # Utility Tools
 # =============================================================================
 
-@mcp.tool("list_available_models")
-async def list_available_models(ctx: Context) -> Dict[str, Any]:
-    """
-    Get a list of available models for different Qolaba API endpoints.
-
-    Returns:
-        Dict containing available models organized by capability
-    """
-    logger.info("Listing available models")
-
+@lru_cache(maxsize=1)
+def _available_models_response() -> Dict[str, Any]:
+    """Build the serialized model catalogue; it is static, so only once."""
     models_data = {
         "models": {
             "text_to_image": ["flux", "stable-diffusion-xl", "stable-diffusion-v2"],
@@ -767,21 +892,60 @@ async def list_available_models(ctx: Context) -> Dict[str, Any]:
     )
 
 
+@mcp.tool("list_available_models")
+async def list_available_models(ctx: Context) -> Dict[str, Any]:
+    """
+    Get a list of available models for different Qolaba API endpoints.
+
+    Returns:
+        Dict containing available models organized by capability
+    """
+    logger.info("Listing available models")
+
+    # Deep copy so callers can never mutate the catalogue cached for the process
+    return {**copy.deepcopy(_available_models_response()), "timestamp": datetime.utcnow()}
+
+
+# The upstream probe result is reused for a while so frequent health polling
+# does not turn into constant traffic against the Qolaba API.
+_HEALTH_CACHE = _ResponseCache(max_size=1)
+_HEALTH_PROBE_TTL = 30.0
+_health_probe_lock = asyncio.Lock()
+
+
 @mcp.tool("server_health")
 async def server_health(ctx: Context) -> Dict[str, Any]:
     """
     Check the health status of the Qolaba MCP Server and API connectivity.
 
+    API connectivity is probed at most once every 30 seconds; concurrent
+    calls share a single probe.
+
     Returns:
         Dict containing server health information
     """
     logger.info("Checking server health")
 
+    cached = _HEALTH_CACHE.get("server_health")
+    if cached is not None:
+        return cached
+
+    async with _health_probe_lock:
+        cached = _HEALTH_CACHE.get("server_health")
+        if cached is None:
+            cached = await _probe_server_health()
+            _HEALTH_CACHE.put("server_health", cached, _HEALTH_PROBE_TTL)
+        return cached
+
+
+async def _probe_server_health() -> Dict[str, Any]:
+    """Probe the Qolaba API and build the serialized health response."""
     try:
-        async with QolabaHTTPClient() as client:
-            # Simple health check - try to get task status for a non-existent task
-            # This should return a 404 but confirms API connectivity
-            response = await client.get("task-status/health-check-test")
+        client = await _get_client()
+
+        # Simple health check - try to get task status for a non-existent task
+        # This should return a 404 but confirms API connectivity
+        response = await client.get("task-status/health-check-test")
 
         # If we get here without exception, API is accessible
         components = {
@@ -800,7 +964,7 @@ async def server_health(ctx: Context) -> Dict[str, Any]:
 
     except HTTPClientError as e:
         # Expected 404 for non-existent task is actually a good sign
-        if getattr(e, "status_code", None) == 404:
+        if e.status_code == 404:
             components = {
                 "api_connectivity": {"status": "healthy", "message": "API is accessible (404 expected)"},
                 "configuration": {"status": "healthy", "message": "Settings loaded successfully"}
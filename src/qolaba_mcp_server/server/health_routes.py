@@ -7,6 +7,11 @@ providing container orchestration-compatible health monitoring.
 
 from __future__ import annotations
 
+import itertools
+import logging
+from typing import Any, Dict, Union
+from uuid import uuid4
+
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import JSONResponse
 
@@ -23,6 +28,133 @@ logger = get_module_logger("server.health_routes")
 # Create router for health endpoints
 health_router = APIRouter(prefix="/health", tags=["health"])
 
+# Allowed values for the ``format`` query parameter
+_FORMAT_PATTERN = "^(json|simple)$"
+
+# OpenAPI response examples, built once at import instead of inline per route
+_HEALTH_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "System is healthy",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "healthy",
+                    "healthy": True,
+                    "timestamp": "2025-09-13T21:02:00Z",
+                    "uptime_seconds": 1234.5,
+                    "version": "1.0.0",
+                    "summary": {
+                        "total_components": 5,
+                        "healthy_components": 5,
+                        "degraded_components": 0,
+                        "unhealthy_components": 0,
+                        "health_check_duration_ms": 45.2
+                    },
+                    "components": [
+                        {
+                            "name": "api_connectivity",
+                            "status": "healthy",
+                            "healthy": True,
+                            "message": "API is reachable",
+                            "response_time_ms": 12.3,
+                            "last_checked": "2025-09-13T21:02:00Z",
+                            "metadata": {"api_base_url": "https://api.qolaba.ai/v1"}
+                        }
+                    ],
+                    "request_id": "health_check_abc123",
+                    "response_time_ms": 45.2
+                }
+            }
+        }
+    },
+    503: {
+        "description": "System is degraded or unhealthy",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "unhealthy",
+                    "healthy": False,
+                    "timestamp": "2025-09-13T21:02:00Z",
+                    "unhealthy_components": [
+                        {
+                            "name": "api_connectivity",
+                            "message": "API connectivity check failed",
+                            "status": "unhealthy"
+                        }
+                    ],
+                    "request_id": "health_check_def456",
+                    "response_time_ms": 67.8
+                }
+            }
+        }
+    }
+}
+
+_READINESS_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "Service is ready to receive traffic",
+        "content": {
+            "application/json": {
+                "example": {
+                    "ready": True,
+                    "status": "ready",
+                    "timestamp": "2025-09-13T21:02:00Z",
+                    "request_id": "readiness_abc123",
+                    "response_time_ms": 15.4
+                }
+            }
+        }
+    },
+    503: {
+        "description": "Service is not ready",
+        "content": {
+            "application/json": {
+                "example": {
+                    "ready": False,
+                    "status": "not_ready",
+                    "reason": "System status: degraded",
+                    "timestamp": "2025-09-13T21:02:00Z",
+                    "request_id": "readiness_def456"
+                }
+            }
+        }
+    }
+}
+
+_LIVENESS_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "Service is alive",
+        "content": {
+            "application/json": {
+                "example": {
+                    "alive": True,
+                    "status": "alive",
+                    "uptime_seconds": 1234.5,
+                    "timestamp": 1694637720.123,
+                    "request_id": "liveness_abc123",
+                    "response_time_ms": 2.1
+                }
+            }
+        }
+    }
+}
+
+_SIMPLE_HEALTH_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "Basic health information",
+        "content": {
+            "application/json": {
+                "example": {
+                    "healthy": True,
+                    "status": "healthy",
+                    "uptime_seconds": 1234.5,
+                    "timestamp": "2025-09-13T21:02:00Z"
+                }
+            }
+        }
+    }
+}
+
 
 @health_router.get(
     "",
@@ -42,78 +174,23 @@ health_router = APIRouter(prefix="/health", tags=["health"])
     
     **Usage Examples:**
     - Docker HEALTHCHECK: `curl -f http://localhost:8000/health`
-    - Kubernetes livenessProbe: `GET /health?detailed=false`
+    - Kubernetes livenessProbe: `GET /health/live` (no upstream API call)
     - Load balancer health check: `GET /health?format=simple`
     """,
-    responses={
-        200: {
-            "description": "System is healthy",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "healthy",
-                        "healthy": True,
-                        "timestamp": "2025-09-13T21:02:00Z",
-                        "uptime_seconds": 1234.5,
-                        "version": "1.0.0",
-                        "summary": {
-                            "total_components": 5,
-                            "healthy_components": 5,
-                            "degraded_components": 0,
-                            "unhealthy_components": 0,
-                            "health_check_duration_ms": 45.2
-                        },
-                        "components": [
-                            {
-                                "name": "api_connectivity",
-                                "status": "healthy",
-                                "healthy": True,
-                                "message": "API is reachable",
-                                "response_time_ms": 12.3,
-                                "last_checked": "2025-09-13T21:02:00Z",
-                                "metadata": {"api_base_url": "https://api.qolaba.ai/v1"}
-                            }
-                        ],
-                        "request_id": "health_check_abc123",
-                        "response_time_ms": 45.2
-                    }
-                }
-            }
-        },
-        503: {
-            "description": "System is degraded or unhealthy",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "unhealthy",
-                        "healthy": False,
-                        "timestamp": "2025-09-13T21:02:00Z",
-                        "unhealthy_components": [
-                            {
-                                "name": "api_connectivity",
-                                "message": "API connectivity check failed",
-                                "status": "unhealthy"
-                            }
-                        ],
-                        "request_id": "health_check_def456",
-                        "response_time_ms": 67.8
-                    }
-                }
-            }
-        }
-    }
+    responses=_HEALTH_RESPONSES
 )
 async def get_health_status(
     request: Request,
     detailed: bool = Query(True, description="Include detailed component information"),
-    format: str = Query("json", regex="^(json|simple)$", description="Response format")
+    format: str = Query("json", pattern=_FORMAT_PATTERN, description="Response format")
 ) -> JSONResponse:
     """Get comprehensive system health status."""
-    logger.debug("Health check route accessed", extra={
-        "detailed": detailed,
-        "format": format,
-        "client_ip": request.client.host if request.client else "unknown"
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Health check route accessed", extra={
+            "detailed": detailed,
+            "format": format,
+            "client_ip": request.client.host if request.client else "unknown"
+        })
     
     return await health_check_endpoint(request, detailed=detailed, format=format)
 
@@ -132,36 +209,7 @@ async def get_health_status(
     - Service mesh ready checks
     - Load balancer backend health
     """,
-    responses={
-        200: {
-            "description": "Service is ready to receive traffic",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "ready": True,
-                        "status": "ready",
-                        "timestamp": "2025-09-13T21:02:00Z",
-                        "request_id": "readiness_abc123",
-                        "response_time_ms": 15.4
-                    }
-                }
-            }
-        },
-        503: {
-            "description": "Service is not ready",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "ready": False,
-                        "status": "not_ready",
-                        "reason": "System status: degraded",
-                        "timestamp": "2025-09-13T21:02:00Z",
-                        "request_id": "readiness_def456"
-                    }
-                }
-            }
-        }
-    }
+    responses=_READINESS_RESPONSES
 )
 async def readiness_probe(request: Request) -> JSONResponse:
     """Kubernetes-style readiness probe."""
@@ -182,23 +230,7 @@ async def readiness_probe(request: Request) -> JSONResponse:
     - Container restart decisions
     - Basic service monitoring
     """,
-    responses={
-        200: {
-            "description": "Service is alive",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "alive": True,
-                        "status": "alive",
-                        "uptime_seconds": 1234.5,
-                        "timestamp": 1694637720.123,
-                        "request_id": "liveness_abc123",
-                        "response_time_ms": 2.1
-                    }
-                }
-            }
-        }
-    }
+    responses=_LIVENESS_RESPONSES
 )
 async def liveness_probe(request: Request) -> JSONResponse:
     """Kubernetes-style liveness probe."""
@@ -214,21 +246,7 @@ async def liveness_probe(request: Request) -> JSONResponse:
     Returns minimal health information with low overhead.
     Suitable for frequent polling by monitoring systems.
     """,
-    responses={
-        200: {
-            "description": "Basic health information",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "healthy": True,
-                        "status": "healthy",
-                        "uptime_seconds": 1234.5,
-                        "timestamp": "2025-09-13T21:02:00Z"
-                    }
-                }
-            }
-        }
-    }
+    responses=_SIMPLE_HEALTH_RESPONSES
 )
 async def simple_health_status() -> dict:
     """Get simple health status with minimal overhead."""
@@ -269,13 +287,21 @@ def get_health_router() -> APIRouter:
     return health_router
 
 
+# Probes hit many times per minute and are never correlated in logs, so they
+# get a cheap process-local counter ID instead of a random UUID
+_PROBE_PATHS = frozenset({"/health/live", "/health/simple"})
+_probe_request_ids = itertools.count()
+
+
 # Middleware for request ID injection (if not already handled)
 @health_router.middleware("http")
 async def add_health_request_id(request: Request, call_next):
     """Add request ID to health check requests if not present."""
     if not hasattr(request.state, 'request_id'):
-        import uuid
-        request.state.request_id = f"health_{uuid.uuid4().hex[:8]}"
+        if request.url.path in _PROBE_PATHS:
+            request.state.request_id = f"health_{next(_probe_request_ids)}"
+        else:
+            request.state.request_id = f"health_{uuid4().hex[:8]}"
     
     response = await call_next(request)
     return response
\ No newline at end of file
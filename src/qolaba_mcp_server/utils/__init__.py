@@ -12,6 +12,7 @@ from .env_loader import (
     get_env_int,
     get_env_float,
     validate_required_env_vars,
+    invalidate_env_cache,
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "get_env_int",
     "get_env_float",
     "validate_required_env_vars",
+    "invalidate_env_cache",
 ]
\ No newline at end of file
@@ -6,10 +6,72 @@ from .env files using python-dotenv.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Environment values are stable for the lifetime of the server, so lookups are
+# memoized by name. Call invalidate_env_cache() after changing os.environ.
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _cached_getenv(key: str) -> Optional[str]:
+    """Return the raw value of an environment variable, memoized per name."""
+    try:
+        return _ENV_CACHE[key]
+    except KeyError:
+        value = _ENV_CACHE[key] = os.environ.get(key)
+        return value
+
+
+def invalidate_env_cache(key: Optional[str] = None) -> None:
+    """
+    Drop memoized environment values.
+
+    Args:
+        key: Variable to forget. If None, the whole cache is cleared.
+    """
+    if key is None:
+        _ENV_CACHE.clear()
+    else:
+        _ENV_CACHE.pop(key, None)
+
+
+# Parsing is pure and env values have few distinct spellings, so parsed results
+# are cached by the raw string; these never go stale when the env changes.
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_FALSY = frozenset({"false", "0", "no", "off", ""})
+
+
+@lru_cache(maxsize=256)
+def _parse_bool(value: str) -> bool:
+    # Canonical spellings resolve without lowercasing
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return value.lower() in _TRUTHY
+
+
+@lru_cache(maxsize=256)
+def _parse_int(value: str, default: int) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+@lru_cache(maxsize=256)
+def _parse_float(value: str, default: float) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return default
 
 
 def load_environment(env_file: Optional[Union[str, Path]] = None) -> bool:
@@ -30,16 +92,22 @@ def load_environment(env_file: Optional[Union[str, Path]] = None) -> bool:
     """
     if env_file is None:
         # Search for .env file in project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        env_file = project_root / ".env"
+        env_file = _PROJECT_ROOT / ".env"
 
     env_path = Path(env_file)
+    if not env_path.exists():
+        return False
 
-    if env_path.exists():
-        load_dotenv(env_path)
-        return True
-
-    return False
+    # Parse once and merge in bulk; variables already set in the process
+    # environment take precedence.
+    values = dotenv_values(env_path)
+    os.environ.update({
+        key: value
+        for key, value in values.items()
+        if value is not None and key not in os.environ
+    })
+    invalidate_env_cache()
+    return True
 
 
 def get_env_var(
@@ -67,7 +135,9 @@ def get_env_var(
         >>> get_env_var("LOG_LEVEL", default="INFO")
         "INFO"
     """
-    value = os.getenv(key, default)
+    value = _cached_getenv(key)
+    if value is None:
+        value = default
 
     if required and value is None:
         raise ValueError(f"Required environment variable '{key}' is not set")
@@ -92,12 +162,12 @@ def get_env_bool(key: str, default: bool = False) -> bool:
         >>> get_env_bool("SSL_VERIFY", default=True)
         True
     """
-    value = os.getenv(key)
+    value = _cached_getenv(key)
 
     if value is None:
         return default
 
-    return value.lower() in ("true", "1", "yes", "on")
+    return _parse_bool(value)
 
 
 def get_env_int(key: str, default: int = 0) -> int:
@@ -117,15 +187,12 @@ def get_env_int(key: str, default: int = 0) -> int:
         >>> get_env_int("RETRY_MAX_ATTEMPTS", default=3)
         3
     """
-    value = os.getenv(key)
+    value = _cached_getenv(key)
 
     if value is None:
         return default
 
-    try:
-        return int(value)
-    except ValueError:
-        return default
+    return _parse_int(value, default)
 
 
 def get_env_float(key: str, default: float = 0.0) -> float:
@@ -143,15 +210,26 @@ def get_env_float(key: str, default: float = 0.0) -> float:
         >>> get_env_float("RETRY_BACKOFF_FACTOR", default=2.0)
         2.0
     """
-    value = os.getenv(key)
+    value = _cached_getenv(key)
 
     if value is None:
         return default
 
-    try:
-        return float(value)
-    except ValueError:
-        return default
+    return _parse_float(value, default)
+
+
+_REQUIRED_VARS = (
+    "QOLABA_API_KEY",
+)
+
+# Placeholder values that should be considered as "not set"
+_PLACEHOLDER_VALUES = frozenset({
+    "your_qolaba_api_key_here",
+    "your_api_key_here",
+    "change_me",
+    "placeholder",
+    "",
+})
 
 
 def validate_required_env_vars() -> None:
@@ -165,27 +243,14 @@ def validate_required_env_vars() -> None:
         >>> validate_required_env_vars()
         # Raises ValueError if QOLABA_API_KEY is not set or has placeholder value
     """
-    required_vars = [
-        "QOLABA_API_KEY",
-    ]
-
-    # Placeholder values that should be considered as "not set"
-    placeholder_values = [
-        "your_qolaba_api_key_here",
-        "your_api_key_here",
-        "change_me",
-        "placeholder",
-        "",
-    ]
-
     missing_vars = []
     placeholder_vars = []
 
-    for var in required_vars:
-        value = os.getenv(var)
+    for var in _REQUIRED_VARS:
+        value = _cached_getenv(var)
         if not value:
             missing_vars.append(var)
-        elif value in placeholder_values:
+        elif value in _PLACEHOLDER_VALUES:
             placeholder_vars.append(var)
 
     error_messages = []
@@ -202,7 +267,8 @@ def validate_required_env_vars() -> None:
         )
 
 
-# Auto-load .env file when module is imported
-if not load_environment():
+# Auto-load .env file when module is imported, unless the caller opted out
+# (tests set QOLABA_SKIP_DOTENV to avoid parsing a developer's local .env)
+if not os.environ.get("QOLABA_SKIP_DOTENV") and not load_environment():
     # If no .env file found, that's okay for testing/CI environments
     pass
\ No newline at end of file
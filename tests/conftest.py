@@ -1,25 +1,106 @@
 from typing import Any, Callable, Dict
 from unittest.mock import AsyncMock, MagicMock
 import json
+import os
 import pytest
 import httpx
 from pathlib import Path
 
+# What a hack: make sure rich.rule is imported before any test runs
+import rich.rule  # noqa: F401
 
-def pytest_collection_modifyitems(items):
-    """Automatically mark tests in integration_tests folder with 'integration' marker."""
+# Tests provide their own environment; skip loading the project .env on import
+os.environ.setdefault("QOLABA_SKIP_DOTENV", "1")
+
+
+_INTEGRATION_MARKER = pytest.mark.integration
+_SERIAL_GROUP_MARKER = pytest.mark.xdist_group("serial")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked 'integration' (deselected by default)",
+    )
+    parser.addoption(
+        "--duration-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="fail the run if any non-integration test body takes longer than SECONDS",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Automatically mark tests in integration_tests folder with 'integration' marker.
+
+    Tests marked ``serial`` are pinned to a single pytest-xdist group so that
+    parallel runs (``-n auto --dist loadgroup``) never interleave them.
+
+    Integration tests are deselected at collection time unless
+    ``--run-integration`` is given or the ``-m`` expression names them.
+    """
+    run_integration = (
+        config.getoption("--run-integration")
+        or "integration" in (config.getoption("markexpr") or "")
+    )
+    selected = []
+    deselected = []
     for item in items:
         # Check if the test is in the integration_tests folder
-        if "integration_tests" in str(item.fspath):
-            item.add_marker(pytest.mark.integration)
+        if "integration_tests" in item.nodeid:
+            item.add_marker(_INTEGRATION_MARKER)
+        if item.get_closest_marker("serial") is not None:
+            item.add_marker(_SERIAL_GROUP_MARKER)
+        if not run_integration and item.get_closest_marker("integration") is not None:
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+# Per-test time budget (``--duration-budget``) and the tests that exceeded it
+_duration_budget = None
+_over_budget = []
+
+
+def pytest_configure(config):
+    global _duration_budget
+    _duration_budget = config.getoption("--duration-budget")
+
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Flag integration tests on their reports; they are exempt from the budget."""
+    outcome = yield
+    report = outcome.get_result()
+    report.integration = item.get_closest_marker("integration") is not None
 
-@pytest.fixture(autouse=True)
-def import_rich_rule():
-    # What a hack
-    import rich.rule  # noqa: F401
 
-    yield
+def pytest_runtest_logreport(report):
+    """Record test bodies that exceed the ``--duration-budget``."""
+    if _duration_budget is None or report.when != "call":
+        return
+    if not getattr(report, "integration", False) and report.duration > _duration_budget:
+        _over_budget.append((report.nodeid, report.duration))
+
+
+def pytest_sessionfinish(session):
+    if _over_budget and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _over_budget:
+        return
+    terminalreporter.section("duration budget exceeded", red=True)
+    for nodeid, duration in sorted(_over_budget, key=lambda entry: -entry[1]):
+        terminalreporter.write_line(f"{duration:.3f}s > {_duration_budget:.3f}s  {nodeid}")
 
 
 def get_fn_name(fn: Callable[..., Any]) -> str:
@@ -30,206 +111,272 @@ def get_fn_name(fn: Callable[..., Any]) -> str:
 # Qolaba MCP Server Test Fixtures
 # =============================================================================
 
-# Import mock strategies for easy access in tests
-from tests.utils.mock_strategies import (
-    QolabaMockResponseGenerator,
-    MockHTTPResponse,
-    mock_qolaba_api_success,
-    mock_qolaba_api_error,
-    mock_qolaba_api_timeout,
-    mock_qolaba_auth_failure,
-    create_mock_api_client,
-    create_test_scenarios
-)
+@pytest.fixture(scope="session")
+def mock_strategies():
+    """Mock strategies module, imported only by sessions that use it."""
+    import tests.utils.mock_strategies as strategies
+
+    return strategies
+
+
+# Canned request/response payloads shared (read-only) by the fixtures below
+_QOLABA_CONFIG = {
+    "api_key": "test_api_key_12345",
+    "base_url": "https://api.qolaba.ai/v1",
+    "timeout": 30,
+    "max_retries": 3,
+    "rate_limit": 100
+}
+
+_SAMPLE_TEXT_TO_IMAGE_REQUEST = {
+    "prompt": "A beautiful sunset over mountains",
+    "model": "flux",
+    "width": 512,
+    "height": 512,
+    "steps": 20,
+    "guidance_scale": 7.5,
+    "seed": 42
+}
+
+_SAMPLE_TEXT_TO_IMAGE_RESPONSE = {
+    "task_id": "task_12345",
+    "status": "completed",
+    "result": {
+        "image_url": "https://cdn.qolaba.ai/images/12345.jpg",
+        "metadata": {
+            "model": "flux",
+            "steps": 20,
+            "seed": 42
+        }
+    },
+    "created_at": "2025-09-13T10:00:00Z",
+    "updated_at": "2025-09-13T10:01:30Z"
+}
+
+_SAMPLE_CHAT_REQUEST = {
+    "messages": [
+        {"role": "user", "content": "Hello, how are you?"}
+    ],
+    "model": "gpt-4",
+    "max_tokens": 150,
+    "temperature": 0.7
+}
+
+_SAMPLE_CHAT_RESPONSE = {
+    "task_id": "chat_67890",
+    "status": "completed",
+    "result": {
+        "choices": [
+            {
+                "message": {
+                    "role": "assistant",
+                    "content": "Hello! I'm doing well, thank you for asking. How can I help you today?"
+                },
+                "finish_reason": "stop"
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 10,
+            "completion_tokens": 20,
+            "total_tokens": 30
+        }
+    }
+}
+
+_SAMPLE_ERROR_RESPONSE = {
+    "error_code": "VALIDATION_ERROR",
+    "message": "Invalid input parameters",
+    "details": {
+        "field": "prompt",
+        "constraint": "required"
+    },
+    "request_id": "req_error_123"
+}
+
+_QOLABA_API_RESPONSES = {
+    "text-to-image": {
+        "success": {
+            "status_code": 200,
+            "json": {
+                "task_id": "task_12345",
+                "status": "pending",
+                "created_at": "2025-09-13T10:00:00Z"
+            }
+        },
+        "error": {
+            "status_code": 400,
+            "json": {
+                "error_code": "VALIDATION_ERROR",
+                "message": "Invalid prompt"
+            }
+        }
+    },
+    "task-status": {
+        "success": {
+            "status_code": 200,
+            "json": {
+                "task_id": "task_12345",
+                "status": "completed",
+                "progress": 100.0,
+                "result": {"image_url": "https://cdn.qolaba.ai/images/12345.jpg"}
+            }
+        },
+        "not_found": {
+            "status_code": 404,
+            "json": {
+                "error_code": "TASK_NOT_FOUND",
+                "message": "Task not found"
+            }
+        }
+    },
+    "chat": {
+        "success": {
+            "status_code": 200,
+            "json": {
+                "task_id": "chat_67890",
+                "status": "completed",
+                "result": {
+                    "choices": [
+                        {
+                            "message": {
+                                "role": "assistant",
+                                "content": "Hello! How can I help you?"
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    }
+}
+
+# Serialize each canned body once so mocks can hand out ready-made bytes
+for _variants in _QOLABA_API_RESPONSES.values():
+    for _meta in _variants.values():
+        _meta["content"] = json.dumps(_meta["json"]).encode()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _route_qolaba_request(request: httpx.Request) -> httpx.Response:
+    """Answer a Qolaba API request with the canned success body for its endpoint."""
+    segments = request.url.path.strip("/").split("/")
+    # ``task-status/<task_id>`` routes on the endpoint name, not the task id
+    endpoint = segments[-2] if segments[-2:-1] == ["task-status"] else segments[-1]
+    variants = _QOLABA_API_RESPONSES.get(endpoint)
+    if variants is None:
+        return httpx.Response(
+            404,
+            json={"error_code": "NOT_FOUND", "message": f"No mock route for {request.url.path}"},
+        )
+    meta = variants["success"]
+    return httpx.Response(meta["status_code"], content=meta["content"], headers=_JSON_HEADERS)
+
+
+@pytest.fixture(scope="session")
+def mock_transport():
+    """httpx transport that serves the canned Qolaba API responses by endpoint."""
+    return httpx.MockTransport(_route_qolaba_request)
+
 
 @pytest.fixture
+async def qolaba_http_client(mock_transport):
+    """QolabaHTTPClient whose requests are answered by ``mock_transport``."""
+    from qolaba_mcp_server.api.client import QolabaHTTPClient
+    from qolaba_mcp_server.config.settings import QolabaSettings
+
+    settings = QolabaSettings(
+        env="test",
+        api_base_url=_QOLABA_CONFIG["base_url"],
+        api_key=_QOLABA_CONFIG["api_key"],
+    )
+    client = QolabaHTTPClient(settings)
+    client._client = httpx.AsyncClient(transport=mock_transport)
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
 def test_data_dir():
     """Path to test data directory."""
     return Path(__file__).parent / "test_data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qolaba_api_key():
     """Mock Qolaba API key for testing."""
     return "test_api_key_12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qolaba_base_url():
     """Qolaba API base URL for testing."""
     return "https://api.qolaba.ai/v1"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_qolaba_config():
     """Mock Qolaba configuration for testing."""
-    return {
-        "api_key": "test_api_key_12345",
-        "base_url": "https://api.qolaba.ai/v1",
-        "timeout": 30,
-        "max_retries": 3,
-        "rate_limit": 100
-    }
+    return _QOLABA_CONFIG
+
+
+# Mock graphs are built once per session and reset after each test, which is
+# much cheaper than rebuilding AsyncMock/MagicMock trees for every test.
+def _reset_after_test(mock: Any):
+    yield mock
+    mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def _mock_httpx_client_template():
+    return AsyncMock(spec=httpx.AsyncClient)
 
 
 @pytest.fixture
-def mock_httpx_client():
+def mock_httpx_client(_mock_httpx_client_template):
     """Mock httpx.AsyncClient for API testing."""
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    return mock_client
+    yield from _reset_after_test(_mock_httpx_client_template)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_to_image_request():
     """Sample text-to-image request data."""
-    return {
-        "prompt": "A beautiful sunset over mountains",
-        "model": "flux",
-        "width": 512,
-        "height": 512,
-        "steps": 20,
-        "guidance_scale": 7.5,
-        "seed": 42
-    }
+    return _SAMPLE_TEXT_TO_IMAGE_REQUEST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_to_image_response():
     """Sample text-to-image response data."""
-    return {
-        "task_id": "task_12345",
-        "status": "completed",
-        "result": {
-            "image_url": "https://cdn.qolaba.ai/images/12345.jpg",
-            "metadata": {
-                "model": "flux",
-                "steps": 20,
-                "seed": 42
-            }
-        },
-        "created_at": "2025-09-13T10:00:00Z",
-        "updated_at": "2025-09-13T10:01:30Z"
-    }
+    return _SAMPLE_TEXT_TO_IMAGE_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chat_request():
     """Sample chat request data."""
-    return {
-        "messages": [
-            {"role": "user", "content": "Hello, how are you?"}
-        ],
-        "model": "gpt-4",
-        "max_tokens": 150,
-        "temperature": 0.7
-    }
+    return _SAMPLE_CHAT_REQUEST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chat_response():
     """Sample chat response data."""
-    return {
-        "task_id": "chat_67890",
-        "status": "completed",
-        "result": {
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": "Hello! I'm doing well, thank you for asking. How can I help you today?"
-                    },
-                    "finish_reason": "stop"
-                }
-            ],
-            "usage": {
-                "prompt_tokens": 10,
-                "completion_tokens": 20,
-                "total_tokens": 30
-            }
-        }
-    }
+    return _SAMPLE_CHAT_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_error_response():
     """Sample API error response."""
-    return {
-        "error_code": "VALIDATION_ERROR",
-        "message": "Invalid input parameters",
-        "details": {
-            "field": "prompt",
-            "constraint": "required"
-        },
-        "request_id": "req_error_123"
-    }
+    return _SAMPLE_ERROR_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_qolaba_api_responses():
-    """Mock API responses for different endpoints."""
-    return {
-        "text-to-image": {
-            "success": {
-                "status_code": 200,
-                "json": {
-                    "task_id": "task_12345",
-                    "status": "pending",
-                    "created_at": "2025-09-13T10:00:00Z"
-                }
-            },
-            "error": {
-                "status_code": 400,
-                "json": {
-                    "error_code": "VALIDATION_ERROR",
-                    "message": "Invalid prompt"
-                }
-            }
-        },
-        "task-status": {
-            "success": {
-                "status_code": 200,
-                "json": {
-                    "task_id": "task_12345",
-                    "status": "completed",
-                    "progress": 100.0,
-                    "result": {"image_url": "https://cdn.qolaba.ai/images/12345.jpg"}
-                }
-            },
-            "not_found": {
-                "status_code": 404,
-                "json": {
-                    "error_code": "TASK_NOT_FOUND",
-                    "message": "Task not found"
-                }
-            }
-        },
-        "chat": {
-            "success": {
-                "status_code": 200,
-                "json": {
-                    "task_id": "chat_67890",
-                    "status": "completed",
-                    "result": {
-                        "choices": [
-                            {
-                                "message": {
-                                    "role": "assistant",
-                                    "content": "Hello! How can I help you?"
-                                }
-                            }
-                        ]
-                    }
-                }
-            }
-        }
-    }
+    """Mock API responses for different endpoints (with pre-encoded ``content`` bytes)."""
+    return _QOLABA_API_RESPONSES
 
 
-@pytest.fixture
-def mock_qolaba_client():
-    """Mock Qolaba API client for testing."""
-    from unittest.mock import AsyncMock
-    
+@pytest.fixture(scope="session")
+def _mock_qolaba_client_template():
     mock_client = AsyncMock()
     
     # Mock common API methods
@@ -247,12 +394,95 @@ def mock_qolaba_client():
 
 
 @pytest.fixture
-def mock_mcp_server():
+def mock_qolaba_client(_mock_qolaba_client_template):
+    """Mock Qolaba API client for testing."""
+    yield from _reset_after_test(_mock_qolaba_client_template)
+
+
+# create_mock_api_client() endpoints and their success response generators
+_MOCK_CLIENT_ENDPOINTS = {
+    "text-to-image": ("text_to_image", "text_to_image_success"),
+    "image-to-image": ("image_to_image", "image_to_image_success"),
+    "text-to-speech": ("text_to_speech", "text_to_speech_success"),
+    "chat": ("chat", "chat_success"),
+}
+
+
+@pytest.fixture(scope="session")
+def _base_mock_client(mock_strategies):
+    client = mock_strategies.create_mock_api_client()
+    defaults = {
+        method: getattr(client, method).return_value
+        for method, _ in _MOCK_CLIENT_ENDPOINTS.values()
+    }
+    return client, defaults
+
+
+def _apply_scenario(client, mock_strategies, scenario: str, **overrides):
+    """Point every endpoint of ``client`` at a ``create_test_scenarios()`` entry.
+
+    ``overrides`` replace top-level fields of the scenario's response body; the
+    extra ``"timeout"`` scenario makes every endpoint raise a timeout instead.
+    """
+    methods = [method for method, _ in _MOCK_CLIENT_ENDPOINTS.values()]
+    if scenario == "timeout":
+        error = httpx.TimeoutException(overrides.get("message", "Timeout after 5.0s"))
+        for method in methods:
+            getattr(client, method).side_effect = error
+        return
+
+    config = mock_strategies.create_test_scenarios()[scenario]
+    response = mock_strategies.MockHTTPResponse(
+        config["status_code"], {**config["response_data"], **overrides}
+    )
+    for method in methods:
+        getattr(client, method).return_value = response
+
+
+@pytest.fixture
+def mock_client(request, _base_mock_client, mock_strategies):
+    """Mock Qolaba API client with canned success responses for every endpoint.
+
+    Mark a test with ``@pytest.mark.qolaba_scenario(name, **overrides)`` to
+    have every endpoint answer with that scenario instead.
+    """
+    client, defaults = _base_mock_client
+    marker = request.node.get_closest_marker("qolaba_scenario")
+    if marker is not None:
+        _apply_scenario(client, mock_strategies, *marker.args, **marker.kwargs)
+    yield client
+    client.reset_mock(return_value=True, side_effect=True)
+    for method, response in defaults.items():
+        getattr(client, method).return_value = response
+
+
+@pytest.fixture
+def mock_client_success(request, mock_client, mock_strategies):
+    """``mock_client`` with success responses built from indirect parameters.
+
+    Parametrize indirectly with ``{"endpoint": ..., **response_kwargs}``; the
+    endpoint defaults to ``"all"``.
+    """
+    params = dict(getattr(request, "param", {}))
+    endpoint = params.pop("endpoint", "all")
+    for name, (method, generator) in _MOCK_CLIENT_ENDPOINTS.items():
+        if endpoint in (name, "all"):
+            response_data = getattr(mock_strategies.QolabaMockResponseGenerator, generator)(**params)
+            getattr(mock_client, method).return_value = mock_strategies.MockHTTPResponse(
+                200, response_data
+            )
+    return mock_client
+
+
+@pytest.fixture(scope="session")
+def _mock_mcp_server_template():
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_mcp_server(_mock_mcp_server_template):
     """Mock MCP server instance for testing."""
-    from unittest.mock import MagicMock
-    
-    mock_server = MagicMock()
-    return mock_server
+    yield from _reset_after_test(_mock_mcp_server_template)
 
 
 @pytest.fixture
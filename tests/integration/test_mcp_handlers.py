@@ -7,7 +7,8 @@ response processing, and error handling.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, DEFAULT, patch
 import json
 from pathlib import Path
 
@@ -32,15 +33,28 @@ from qolaba_mcp_server.models.api_models import TextToImageRequest
 class TestQolabaMCPOrchestrator:
     """Integration tests for QolabaMCPOrchestrator."""
 
-    @pytest.fixture
+    # Shared per module: the request/response data below is read-only
+    # (MappingProxyType where the code under test does not require a real dict).
+    @pytest.fixture(scope="module")
     def orchestrator(self):
         """Create orchestrator instance for testing."""
         return QolabaMCPOrchestrator()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def _default_operation_models(self, orchestrator):
+        """Snapshot of the orchestrator's operation-model mapping."""
+        return dict(orchestrator._operation_models)
+
+    @pytest.fixture(autouse=True)
+    def _reset_operation_models(self, orchestrator, _default_operation_models):
+        """Restore the shared orchestrator's operation models after each test."""
+        yield
+        orchestrator._operation_models = dict(_default_operation_models)
+
+    @pytest.fixture(scope="module")
     def valid_text_to_image_data(self):
         """Valid text-to-image request data."""
-        return {
+        return MappingProxyType({
             "prompt": "A beautiful sunset over mountains",
             "model": "flux",
             "width": 512,
@@ -48,12 +62,17 @@ class TestQolabaMCPOrchestrator:
             "steps": 20,
             "guidance_scale": 7.5,
             "seed": 42
-        }
+        })
+
+    @pytest.fixture(scope="module")
+    def validated_text_to_image_request(self, valid_text_to_image_data):
+        """Validated text-to-image request model, built once per module."""
+        return TextToImageRequest(**valid_text_to_image_data)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_api_success_response(self):
         """Mock successful API response."""
-        return {
+        return MappingProxyType({
             "content": {
                 "task_id": "task_12345",
                 "status": "pending",
@@ -62,11 +81,11 @@ class TestQolabaMCPOrchestrator:
             "status_code": 200,
             "headers": {"x-request-id": "req_67890"},
             "request_id": "test_request_123"
-        }
+        })
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_task_status_response(self):
-        """Mock task status API response."""
+        """Mock task status API response (plain dict: used as HTTP response content)."""
         return {
             "task_id": "task_12345",
             "status": "completed",
@@ -78,92 +97,133 @@ class TestQolabaMCPOrchestrator:
             "updated_at": "2025-09-13T10:01:30Z"
         }
 
+    @pytest.fixture(scope="module")
+    def make_mock_http_client(self):
+        """Factory for an async HTTP client mock usable as ``async with`` target."""
+        def factory(content=None, status_code=200, headers=None, method="post", side_effect=None):
+            client = AsyncMock()
+            client.__aenter__.return_value = client
+            request = getattr(client, method)
+            if side_effect is not None:
+                request.side_effect = side_effect
+            else:
+                request.return_value = SimpleNamespace(
+                    content=content,
+                    status_code=status_code,
+                    headers=headers or {}
+                )
+            return client
+
+        return factory
+
     @pytest.mark.asyncio
     async def test_execute_operation_success(
         self,
         orchestrator,
         valid_text_to_image_data,
+        validated_text_to_image_request,
         mock_api_success_response
     ):
         """Test successful operation execution."""
-        with patch.object(orchestrator, '_validate_request') as mock_validate:
-            with patch.object(orchestrator, '_execute_api_call') as mock_api_call:
-                with patch.object(orchestrator, '_process_api_response') as mock_process:
-                    # Setup mocks
-                    mock_validate.return_value = ValidationResult(
-                        success=True,
-                        data=TextToImageRequest(**valid_text_to_image_data)
-                    )
-                    mock_api_call.return_value = mock_api_success_response
-                    mock_process.return_value = {"success": True, "task_id": "task_12345"}
-                    
-                    # Execute operation
-                    result = await orchestrator.execute_operation(
-                        OperationType.TEXT_TO_IMAGE,
-                        valid_text_to_image_data,
-                        "test_request_123"
-                    )
-                    
-                    # Verify workflow
-                    assert result["success"] is True
-                    assert result["task_id"] == "task_12345"
-                    mock_validate.assert_called_once_with(OperationType.TEXT_TO_IMAGE, valid_text_to_image_data)
-                    mock_api_call.assert_called_once()
-                    mock_process.assert_called_once_with(mock_api_success_response, OperationType.TEXT_TO_IMAGE, "test_request_123")
+        with patch.multiple(
+            orchestrator,
+            _validate_request=DEFAULT,
+            _execute_api_call=DEFAULT,
+            _process_api_response=DEFAULT,
+        ) as mocks:
+            mock_validate = mocks['_validate_request']
+            mock_api_call = mocks['_execute_api_call']
+            mock_process = mocks['_process_api_response']
+
+            # Setup mocks
+            mock_validate.return_value = ValidationResult(
+                success=True,
+                data=validated_text_to_image_request
+            )
+            mock_api_call.return_value = mock_api_success_response
+            mock_process.return_value = {"success": True, "task_id": "task_12345"}
+            
+            # Execute operation
+            result = await orchestrator.execute_operation(
+                OperationType.TEXT_TO_IMAGE,
+                valid_text_to_image_data,
+                "test_request_123"
+            )
+            
+            # Verify workflow
+            assert result["success"] is True
+            assert result["task_id"] == "task_12345"
+            mock_validate.assert_called_once_with(OperationType.TEXT_TO_IMAGE, valid_text_to_image_data)
+            mock_api_call.assert_called_once()
+            mock_process.assert_called_once_with(mock_api_success_response, OperationType.TEXT_TO_IMAGE, "test_request_123")
 
     @pytest.mark.asyncio
     async def test_execute_operation_validation_error(self, orchestrator):
         """Test operation execution with validation error."""
         invalid_data = {"prompt": ""}  # Empty prompt should fail validation
         
-        with patch.object(orchestrator, '_validate_request') as mock_validate:
-            with patch.object(orchestrator, '_create_validation_error_response') as mock_error:
-                # Setup mocks
-                validation_result = ValidationResult(success=False, error="Prompt cannot be empty")
-                mock_validate.return_value = validation_result
-                mock_error.return_value = {"error": "validation_error", "message": "Prompt cannot be empty"}
-                
-                # Execute operation
-                result = await orchestrator.execute_operation(
-                    OperationType.TEXT_TO_IMAGE,
-                    invalid_data
-                )
-                
-                # Verify error handling
-                assert result["error"] == "validation_error"
-                assert "Prompt cannot be empty" in result["message"]
-                mock_validate.assert_called_once()
-                mock_error.assert_called_once_with(validation_result)
+        with patch.multiple(
+            orchestrator,
+            _validate_request=DEFAULT,
+            _create_validation_error_response=DEFAULT,
+        ) as mocks:
+            mock_validate = mocks['_validate_request']
+            mock_error = mocks['_create_validation_error_response']
+
+            # Setup mocks
+            validation_result = ValidationResult(success=False, error="Prompt cannot be empty")
+            mock_validate.return_value = validation_result
+            mock_error.return_value = {"error": "validation_error", "message": "Prompt cannot be empty"}
+            
+            # Execute operation
+            result = await orchestrator.execute_operation(
+                OperationType.TEXT_TO_IMAGE,
+                invalid_data
+            )
+            
+            # Verify error handling
+            assert result["error"] == "validation_error"
+            assert "Prompt cannot be empty" in result["message"]
+            mock_validate.assert_called_once()
+            mock_error.assert_called_once_with(validation_result)
 
     @pytest.mark.asyncio
     async def test_execute_operation_http_error(
         self,
         orchestrator,
-        valid_text_to_image_data
+        valid_text_to_image_data,
+        validated_text_to_image_request
     ):
         """Test operation execution with HTTP client error."""
-        with patch.object(orchestrator, '_validate_request') as mock_validate:
-            with patch.object(orchestrator, '_execute_api_call') as mock_api_call:
-                with patch.object(orchestrator, '_create_http_error_response') as mock_error:
-                    # Setup mocks
-                    mock_validate.return_value = ValidationResult(
-                        success=True,
-                        data=TextToImageRequest(**valid_text_to_image_data)
-                    )
-                    http_error = HTTPClientError("API Error", 500)
-                    mock_api_call.side_effect = http_error
-                    mock_error.return_value = {"error": "api_client_error", "message": "API request failed: API Error"}
-                    
-                    # Execute operation
-                    result = await orchestrator.execute_operation(
-                        OperationType.TEXT_TO_IMAGE,
-                        valid_text_to_image_data
-                    )
-                    
-                    # Verify error handling
-                    assert result["error"] == "api_client_error"
-                    assert "API request failed" in result["message"]
-                    mock_error.assert_called_once_with(http_error)
+        with patch.multiple(
+            orchestrator,
+            _validate_request=DEFAULT,
+            _execute_api_call=DEFAULT,
+            _create_http_error_response=DEFAULT,
+        ) as mocks:
+            mock_validate = mocks['_validate_request']
+            mock_api_call = mocks['_execute_api_call']
+            mock_error = mocks['_create_http_error_response']
+
+            # Setup mocks
+            mock_validate.return_value = ValidationResult(
+                success=True,
+                data=validated_text_to_image_request
+            )
+            http_error = HTTPClientError("API Error", 500)
+            mock_api_call.side_effect = http_error
+            mock_error.return_value = {"error": "api_client_error", "message": "API request failed: API Error"}
+            
+            # Execute operation
+            result = await orchestrator.execute_operation(
+                OperationType.TEXT_TO_IMAGE,
+                valid_text_to_image_data
+            )
+            
+            # Verify error handling
+            assert result["error"] == "api_client_error"
+            assert "API request failed" in result["message"]
+            mock_error.assert_called_once_with(http_error)
 
     @pytest.mark.asyncio
     async def test_execute_operation_unexpected_error(
@@ -172,76 +232,92 @@ class TestQolabaMCPOrchestrator:
         valid_text_to_image_data
     ):
         """Test operation execution with unexpected error."""
-        with patch.object(orchestrator, '_validate_request') as mock_validate:
-            with patch.object(orchestrator, '_create_unexpected_error_response') as mock_error:
-                # Setup mocks
-                unexpected_error = Exception("Something went wrong")
-                mock_validate.side_effect = unexpected_error
-                mock_error.return_value = {"error": "internal_error", "message": "An unexpected error occurred"}
-                
-                # Execute operation
-                result = await orchestrator.execute_operation(
-                    OperationType.TEXT_TO_IMAGE,
-                    valid_text_to_image_data
-                )
-                
-                # Verify error handling
-                assert result["error"] == "internal_error"
-                assert "unexpected error occurred" in result["message"]
-                mock_error.assert_called_once_with(unexpected_error)
+        with patch.multiple(
+            orchestrator,
+            _validate_request=DEFAULT,
+            _create_unexpected_error_response=DEFAULT,
+        ) as mocks:
+            mock_validate = mocks['_validate_request']
+            mock_error = mocks['_create_unexpected_error_response']
+
+            # Setup mocks
+            unexpected_error = Exception("Something went wrong")
+            mock_validate.side_effect = unexpected_error
+            mock_error.return_value = {"error": "internal_error", "message": "An unexpected error occurred"}
+            
+            # Execute operation
+            result = await orchestrator.execute_operation(
+                OperationType.TEXT_TO_IMAGE,
+                valid_text_to_image_data
+            )
+            
+            # Verify error handling
+            assert result["error"] == "internal_error"
+            assert "unexpected error occurred" in result["message"]
+            mock_error.assert_called_once_with(unexpected_error)
 
     @pytest.mark.asyncio
-    async def test_get_task_status_success(self, orchestrator, mock_task_status_response):
+    async def test_get_task_status_success(
+        self,
+        orchestrator,
+        mock_task_status_response,
+        make_mock_http_client
+    ):
         """Test successful task status retrieval."""
-        with patch('qolaba_mcp_server.core.business_logic.QolabaHTTPClient') as mock_client_class:
-            with patch('qolaba_mcp_server.core.business_logic.ResponseSerializer') as mock_serializer:
-                # Setup mocks
-                mock_client = AsyncMock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
-                
-                mock_response = AsyncMock()
-                mock_response.content = mock_task_status_response
-                mock_client.get.return_value = mock_response
-                
-                mock_mcp_response = MagicMock()
-                mock_serializer.create_task_status_response.return_value = mock_mcp_response
-                mock_serializer.serialize_to_dict.return_value = {"task_status": "completed"}
-                
-                # Execute task status request
-                result = await orchestrator.get_task_status("task_12345", "request_123")
-                
-                # Verify workflow
-                assert result["task_status"] == "completed"
-                mock_client.get.assert_called_once_with("task-status/task_12345")
-                mock_serializer.create_task_status_response.assert_called_once()
+        with patch.multiple(
+            'qolaba_mcp_server.core.business_logic',
+            QolabaHTTPClient=DEFAULT,
+            ResponseSerializer=DEFAULT,
+        ) as mocks:
+            mock_client_class = mocks['QolabaHTTPClient']
+            mock_serializer = mocks['ResponseSerializer']
+
+            # Setup mocks
+            mock_client = make_mock_http_client(mock_task_status_response, method="get")
+            mock_client_class.return_value = mock_client
+
+            mock_mcp_response = object()
+            mock_serializer.create_task_status_response.return_value = mock_mcp_response
+            mock_serializer.serialize_to_dict.return_value = {"task_status": "completed"}
+            
+            # Execute task status request
+            result = await orchestrator.get_task_status("task_12345", "request_123")
+            
+            # Verify workflow
+            assert result["task_status"] == "completed"
+            mock_client.get.assert_called_once_with("task-status/task_12345")
+            mock_serializer.create_task_status_response.assert_called_once()
+            mock_serializer.serialize_to_dict.assert_called_once_with(mock_mcp_response)
 
     @pytest.mark.asyncio
-    async def test_get_task_status_http_error(self, orchestrator):
+    async def test_get_task_status_http_error(self, orchestrator, make_mock_http_client):
         """Test task status retrieval with HTTP error."""
-        with patch('qolaba_mcp_server.core.business_logic.QolabaHTTPClient') as mock_client_class:
-            with patch.object(orchestrator, '_create_http_error_response') as mock_error:
-                # Setup mocks
-                mock_client = AsyncMock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
-                
-                http_error = HTTPClientError("Task not found", 404)
-                mock_client.get.side_effect = http_error
-                mock_error.return_value = {"error": "task_not_found", "message": "Task not found"}
-                
-                # Execute task status request
-                result = await orchestrator.get_task_status("nonexistent_task")
-                
-                # Verify error handling
-                assert result["error"] == "task_not_found"
-                mock_error.assert_called_once_with(http_error)
+        with patch('qolaba_mcp_server.core.business_logic.QolabaHTTPClient') as mock_client_class, \
+                patch.object(orchestrator, '_create_http_error_response') as mock_error:
+            # Setup mocks
+            http_error = HTTPClientError("Task not found", 404)
+            mock_client = make_mock_http_client(method="get", side_effect=http_error)
+            mock_client_class.return_value = mock_client
+            mock_error.return_value = {"error": "task_not_found", "message": "Task not found"}
+            
+            # Execute task status request
+            result = await orchestrator.get_task_status("nonexistent_task")
+            
+            # Verify error handling
+            assert result["error"] == "task_not_found"
+            mock_error.assert_called_once_with(http_error)
 
     @pytest.mark.asyncio
-    async def test_validate_request_success(self, orchestrator, valid_text_to_image_data):
+    async def test_validate_request_success(
+        self,
+        orchestrator,
+        valid_text_to_image_data,
+        validated_text_to_image_request
+    ):
         """Test successful request validation."""
         with patch('qolaba_mcp_server.core.business_logic.validate_request_data') as mock_validate:
             # Setup mock
-            validated_data = TextToImageRequest(**valid_text_to_image_data)
-            mock_validate.return_value = ValidationResult(success=True, data=validated_data)
+            mock_validate.return_value = ValidationResult(success=True, data=validated_text_to_image_request)
             
             # Execute validation
             result = await orchestrator._validate_request(OperationType.TEXT_TO_IMAGE, valid_text_to_image_data)
@@ -262,21 +338,23 @@ class TestQolabaMCPOrchestrator:
             assert "Unsupported operation type" in result.error
 
     @pytest.mark.asyncio
-    async def test_execute_api_call_success(self, orchestrator, valid_text_to_image_data):
+    async def test_execute_api_call_success(
+        self,
+        orchestrator,
+        validated_text_to_image_request,
+        make_mock_http_client
+    ):
         """Test successful API call execution."""
         with patch('qolaba_mcp_server.core.business_logic.QolabaHTTPClient') as mock_client_class:
             # Setup mocks
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            
-            mock_response = AsyncMock()
-            mock_response.content = {"task_id": "task_123"}
-            mock_response.status_code = 200
-            mock_response.headers = {"x-request-id": "req_456"}
-            mock_client.post.return_value = mock_response
-            
-            validated_data = TextToImageRequest(**valid_text_to_image_data)
-            
+            mock_client = make_mock_http_client(
+                {"task_id": "task_123"},
+                headers={"x-request-id": "req_456"}
+            )
+            mock_client_class.return_value = mock_client
+
+            validated_data = validated_text_to_image_request
+
             # Execute API call
             result = await orchestrator._execute_api_call(
                 OperationType.TEXT_TO_IMAGE,
@@ -295,27 +373,34 @@ class TestQolabaMCPOrchestrator:
 
     def test_process_api_response_success(self, orchestrator, mock_api_success_response):
         """Test successful API response processing."""
-        with patch('qolaba_mcp_server.core.business_logic.process_qolaba_response') as mock_process:
-            with patch('qolaba_mcp_server.core.business_logic.ResponseSerializer') as mock_serializer:
-                # Setup mocks
-                mock_mcp_response = MagicMock()
-                mock_process.return_value = mock_mcp_response
-                mock_serializer.serialize_to_dict.return_value = {"processed": True}
-                
-                # Execute response processing
-                result = orchestrator._process_api_response(
-                    mock_api_success_response,
-                    OperationType.TEXT_TO_IMAGE,
-                    "request_123"
-                )
-                
-                # Verify processing
-                assert result["processed"] is True
-                mock_process.assert_called_once_with(
-                    mock_api_success_response["content"],
-                    "text-to-image",
-                    request_id="request_123"
-                )
+        with patch.multiple(
+            'qolaba_mcp_server.core.business_logic',
+            process_qolaba_response=DEFAULT,
+            ResponseSerializer=DEFAULT,
+        ) as mocks:
+            mock_process = mocks['process_qolaba_response']
+            mock_serializer = mocks['ResponseSerializer']
+
+            # Setup mocks
+            mock_mcp_response = object()
+            mock_process.return_value = mock_mcp_response
+            mock_serializer.serialize_to_dict.return_value = {"processed": True}
+            
+            # Execute response processing
+            result = orchestrator._process_api_response(
+                mock_api_success_response,
+                OperationType.TEXT_TO_IMAGE,
+                "request_123"
+            )
+            
+            # Verify processing
+            assert result["processed"] is True
+            mock_process.assert_called_once_with(
+                mock_api_success_response["content"],
+                "text-to-image",
+                request_id="request_123"
+            )
+            mock_serializer.serialize_to_dict.assert_called_once_with(mock_mcp_response)
 
     def test_process_api_response_unexpected_format(self, orchestrator):
         """Test API response processing with unexpected format."""
@@ -337,7 +422,7 @@ class TestQolabaMCPOrchestrator:
     def test_error_response_creation_methods(self, orchestrator):
         """Test all error response creation methods."""
         with patch('qolaba_mcp_server.core.business_logic.ResponseSerializer') as mock_serializer:
-            mock_serializer.create_error_response.return_value = MagicMock()
+            mock_serializer.create_error_response.return_value = object()
             mock_serializer.serialize_to_dict.return_value = {"error": "test"}
             
             # Test validation error response
@@ -363,7 +448,45 @@ class TestQolabaMCPOrchestrator:
 class TestMCPConvenienceFunctions:
     """Test MCP convenience functions for all operation types."""
 
-    @pytest.fixture
+    CONVENIENCE_CASES = [
+        pytest.param(
+            execute_text_to_image, OperationType.TEXT_TO_IMAGE,
+            {"prompt": "test image"}, "req_123",
+            id="text_to_image",
+        ),
+        pytest.param(
+            execute_image_to_image, OperationType.IMAGE_TO_IMAGE,
+            {"image": "base64_data", "prompt": "transform image"}, "req_456",
+            id="image_to_image",
+        ),
+        pytest.param(
+            execute_inpainting, OperationType.INPAINTING,
+            {"image": "base64_data", "mask": "mask_data", "prompt": "fill area"}, None,
+            id="inpainting",
+        ),
+        pytest.param(
+            execute_replace_background, OperationType.REPLACE_BACKGROUND,
+            {"image": "base64_data", "prompt": "new background"}, None,
+            id="replace_background",
+        ),
+        pytest.param(
+            execute_text_to_speech, OperationType.TEXT_TO_SPEECH,
+            {"text": "Hello world", "voice": "alloy"}, None,
+            id="text_to_speech",
+        ),
+        pytest.param(
+            execute_chat, OperationType.CHAT,
+            {"messages": [{"role": "user", "content": "Hello"}]}, None,
+            id="chat",
+        ),
+        pytest.param(
+            execute_vector_store, OperationType.STORE_VECTOR_DB,
+            {"file": "file_path", "collection_name": "test_collection"}, None,
+            id="vector_store",
+        ),
+    ]
+
+    @pytest.fixture(scope="module")
     def mock_orchestrator_success(self):
         """Mock orchestrator that returns success."""
         mock_orch = AsyncMock()
@@ -371,123 +494,51 @@ class TestMCPConvenienceFunctions:
         mock_orch.get_task_status.return_value = {"status": "completed", "progress": 100.0}
         return mock_orch
 
-    @pytest.mark.asyncio
-    async def test_execute_text_to_image(self, mock_orchestrator_success):
-        """Test text-to-image convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"prompt": "test image"}
-            result = await execute_text_to_image(request_data, "req_123")
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.TEXT_TO_IMAGE,
-                request_data,
-                "req_123"
-            )
+    @pytest.fixture(autouse=True)
+    def _patch_orchestrator(self, mock_orchestrator_success, monkeypatch):
+        """Route get_orchestrator() to the shared mock; clear its calls afterwards."""
+        monkeypatch.setattr(
+            "qolaba_mcp_server.core.business_logic.get_orchestrator",
+            lambda: mock_orchestrator_success
+        )
+        yield
+        mock_orchestrator_success.reset_mock()
 
     @pytest.mark.asyncio
-    async def test_execute_image_to_image(self, mock_orchestrator_success):
-        """Test image-to-image convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"image": "base64_data", "prompt": "transform image"}
-            result = await execute_image_to_image(request_data, "req_456")
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.IMAGE_TO_IMAGE,
-                request_data,
-                "req_456"
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_inpainting(self, mock_orchestrator_success):
-        """Test inpainting convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"image": "base64_data", "mask": "mask_data", "prompt": "fill area"}
-            result = await execute_inpainting(request_data)
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.INPAINTING,
-                request_data,
-                None
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_replace_background(self, mock_orchestrator_success):
-        """Test background replacement convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"image": "base64_data", "prompt": "new background"}
-            result = await execute_replace_background(request_data)
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.REPLACE_BACKGROUND,
-                request_data,
-                None
-            )
+    @pytest.mark.parametrize("fn,op,data,req_id", CONVENIENCE_CASES)
+    async def test_execute_convenience(self, mock_orchestrator_success, fn, op, data, req_id):
+        """Test each execute_* convenience function delegates to the orchestrator."""
+        if req_id is None:
+            result = await fn(data)
+        else:
+            result = await fn(data, req_id)
 
-    @pytest.mark.asyncio
-    async def test_execute_text_to_speech(self, mock_orchestrator_success):
-        """Test text-to-speech convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"text": "Hello world", "voice": "alloy"}
-            result = await execute_text_to_speech(request_data)
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.TEXT_TO_SPEECH,
-                request_data,
-                None
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_chat(self, mock_orchestrator_success):
-        """Test chat convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"messages": [{"role": "user", "content": "Hello"}]}
-            result = await execute_chat(request_data)
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.CHAT,
-                request_data,
-                None
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_vector_store(self, mock_orchestrator_success):
-        """Test vector store convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            request_data = {"file": "file_path", "collection_name": "test_collection"}
-            result = await execute_vector_store(request_data)
-            
-            assert result["success"] is True
-            mock_orchestrator_success.execute_operation.assert_called_once_with(
-                OperationType.STORE_VECTOR_DB,
-                request_data,
-                None
-            )
+        assert result["success"] is True
+        mock_orchestrator_success.execute_operation.assert_called_once_with(op, data, req_id)
 
     @pytest.mark.asyncio
     async def test_get_task_status_unified(self, mock_orchestrator_success):
         """Test unified task status convenience function."""
-        with patch('qolaba_mcp_server.core.business_logic.get_orchestrator', return_value=mock_orchestrator_success):
-            result = await get_task_status_unified("task_789", "req_999")
-            
-            assert result["status"] == "completed"
-            mock_orchestrator_success.get_task_status.assert_called_once_with("task_789", "req_999")
+        result = await get_task_status_unified("task_789", "req_999")
+
+        assert result["status"] == "completed"
+        mock_orchestrator_success.get_task_status.assert_called_once_with("task_789", "req_999")
 
 
+@pytest.mark.serial
 class TestGlobalOrchestrator:
     """Test global orchestrator instance management."""
 
-    def test_get_orchestrator_singleton(self):
-        """Test that get_orchestrator returns singleton instance."""
-        # Clear any existing instance
+    @pytest.fixture(autouse=True)
+    def _reset_singleton(self):
+        """Clear the module-level orchestrator before and after each test."""
         import qolaba_mcp_server.core.business_logic as bl_module
         bl_module._orchestrator = None
-        
+        yield
+        bl_module._orchestrator = None
+
+    def test_get_orchestrator_singleton(self):
+        """Test that get_orchestrator returns singleton instance."""
         # Get first instance
         orch1 = get_orchestrator()
         assert isinstance(orch1, QolabaMCPOrchestrator)
@@ -495,55 +546,51 @@ class TestGlobalOrchestrator:
         # Get second instance - should be the same
         orch2 = get_orchestrator()
         assert orch1 is orch2
-        
-        # Clear for other tests
-        bl_module._orchestrator = None
 
 
 class TestMCPIntegrationScenarios:
     """End-to-end integration test scenarios."""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_complete_text_to_image_workflow(self):
+    @pytest.mark.skip(reason="Full integration test requires real API setup")
+    def test_complete_text_to_image_workflow(self):
         """Test complete text-to-image workflow from request to response."""
         # This would be a full integration test that tests the complete workflow
         # from MCP request through validation, API call, and response processing
-        pytest.skip("Full integration test requires real API setup")
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_error_recovery_scenarios(self):
+    @pytest.mark.skip(reason="Full integration test requires real API setup")
+    def test_error_recovery_scenarios(self):
         """Test error recovery in integration scenarios."""
         # This would test various error scenarios in the complete workflow
-        pytest.skip("Full integration test requires real API setup")
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_concurrent_operations(self):
+    @pytest.mark.skip(reason="Performance integration test requires specialized setup")
+    def test_concurrent_operations(self):
         """Test handling of concurrent operations."""
         # This would test the system's ability to handle multiple concurrent requests
-        pytest.skip("Performance integration test requires specialized setup")
+
+
+# Operation types that take a request model (task status does not)
+_REQUEST_OPERATIONS = [op for op in OperationType if op != OperationType.TASK_STATUS]
 
 
 class TestMCPValidationIntegration:
     """Test integration with MCP validation layer."""
 
-    @pytest.mark.asyncio
-    async def test_validation_integration_all_models(self):
-        """Test validation integration with all supported models."""
-        orchestrator = QolabaMCPOrchestrator()
-        
-        # Test that all operation types have corresponding models
-        for operation_type in OperationType:
-            if operation_type != OperationType.TASK_STATUS:  # Task status doesn't use request model
-                model_class = orchestrator._operation_models.get(operation_type)
-                assert model_class is not None, f"No model defined for {operation_type}"
+    @pytest.fixture(scope="module")
+    def orchestrator(self):
+        """Create orchestrator instance for testing."""
+        return QolabaMCPOrchestrator()
+
+    @pytest.mark.parametrize("operation_type", _REQUEST_OPERATIONS, ids=lambda op: op.value)
+    def test_validation_integration_all_models(self, orchestrator, operation_type):
+        """Test that each operation type has a corresponding request model."""
+        model_class = orchestrator._operation_models.get(operation_type)
+        assert model_class is not None, f"No model defined for {operation_type}"
 
-    def test_operation_model_mapping_completeness(self):
+    def test_operation_model_mapping_completeness(self, orchestrator):
         """Test that operation model mapping is complete."""
-        orchestrator = QolabaMCPOrchestrator()
-        
         expected_operations = {
             OperationType.TEXT_TO_IMAGE,
             OperationType.IMAGE_TO_IMAGE,
@@ -553,9 +600,8 @@ class TestMCPValidationIntegration:
             OperationType.CHAT,
             OperationType.STORE_VECTOR_DB
         }
-        
-        mapped_operations = set(orchestrator._operation_models.keys())
-        assert mapped_operations == expected_operations
+
+        assert set(orchestrator._operation_models) == expected_operations
 
 
 class TestMCPErrorHandlingIntegration:
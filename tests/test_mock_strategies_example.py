@@ -5,30 +5,48 @@ This file shows how to use the comprehensive mock strategies to test
 the Qolaba API client without external dependencies.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from tests.utils.mock_strategies import (
     QolabaMockResponseGenerator,
     MockHTTPResponse,
-    mock_qolaba_api_success,
-    mock_qolaba_api_error,
-    mock_qolaba_api_timeout,
-    mock_qolaba_auth_failure,
     mock_qolaba_api_rate_limited,
     mock_qolaba_api_context,
-    create_mock_api_client,
     create_test_scenarios
 )
 
 
+# Endpoint methods every mock API client must expose
+_EXPECTED_METHODS = frozenset({"text_to_image", "image_to_image", "text_to_speech", "chat"})
+
+# Canned responses built once at import; tests only read them
+_CANNED = {
+    "tti_ok": MockHTTPResponse(
+        200, QolabaMockResponseGenerator.text_to_image_success(model="custom_model")
+    ),
+    "tti_pending": MockHTTPResponse(
+        200, QolabaMockResponseGenerator.text_to_image_pending()
+    ),
+    "chat_err": MockHTTPResponse(
+        400, QolabaMockResponseGenerator.error_response("INVALID_INPUT", "Bad request")
+    ),
+}
+
+
 class TestMockStrategiesExamples:
     """Example tests demonstrating mock strategy usage."""
     
-    @mock_qolaba_api_success(endpoint="text-to-image", model="flux", width=1024, height=1024)
-    async def test_successful_text_to_image_with_decorator(self, mock_client):
-        """Test successful text-to-image generation using success decorator."""
-        # The decorator automatically mocks the API client
-        response = await mock_client.text_to_image(
+    @pytest.mark.parametrize(
+        "mock_client_success",
+        [{"endpoint": "text-to-image", "model": "flux", "width": 1024, "height": 1024}],
+        indirect=True
+    )
+    async def test_successful_text_to_image_with_fixture(self, mock_client_success):
+        """Test successful text-to-image generation using the success fixture."""
+        # The fixture configures the shared mock API client
+        response = await mock_client_success.text_to_image(
             prompt="A beautiful landscape",
             model="flux",
             width=1024,
@@ -43,10 +61,9 @@ class TestMockStrategiesExamples:
         assert response_data["result"]["metadata"]["model"] == "flux"
         assert response_data["result"]["metadata"]["width"] == 1024
     
-    @mock_qolaba_api_error(status_code=400, error_code="VALIDATION_ERROR", 
-                          message="Invalid prompt", details={"field": "prompt"})
-    async def test_validation_error_with_decorator(self, mock_client):
-        """Test API validation error using error decorator."""
+    @pytest.mark.qolaba_scenario("validation_error", message="Invalid prompt", details={"field": "prompt"})
+    async def test_validation_error_scenario(self, mock_client):
+        """Test API validation error using the validation_error scenario."""
         response = await mock_client.text_to_image(prompt="")
         
         # Verify error response
@@ -56,16 +73,16 @@ class TestMockStrategiesExamples:
         assert error_data["message"] == "Invalid prompt"
         assert error_data["details"]["field"] == "prompt"
     
-    @mock_qolaba_api_timeout(timeout_duration=5.0)
+    @pytest.mark.qolaba_scenario("timeout")
     async def test_timeout_scenario(self, mock_client):
-        """Test timeout handling using timeout decorator."""
-        # The decorator configures the mock to raise TimeoutException
+        """Test timeout handling using the timeout scenario."""
+        # The scenario configures the mock to raise TimeoutException
         with pytest.raises(Exception):  # httpx.TimeoutException
             await mock_client.text_to_image(prompt="Test prompt")
     
-    @mock_qolaba_auth_failure(auth_error_type="invalid_key")
+    @pytest.mark.qolaba_scenario("auth_error")
     async def test_authentication_failure(self, mock_client):
-        """Test authentication failure using auth failure decorator."""
+        """Test authentication failure using the auth_error scenario."""
         response = await mock_client.text_to_image(prompt="Test prompt")
         
         assert response.status_code == 401
@@ -85,14 +102,7 @@ class TestMockStrategiesExamples:
     
     async def test_context_manager_usage(self):
         """Test using context manager for complex scenarios."""
-        responses = {
-            'text_to_image': MockHTTPResponse(
-                200, QolabaMockResponseGenerator.text_to_image_success(model="custom_model")
-            ),
-            'chat': MockHTTPResponse(
-                400, QolabaMockResponseGenerator.error_response("INVALID_INPUT", "Bad request")
-            )
-        }
+        responses = {'text_to_image': _CANNED['tti_ok'], 'chat': _CANNED['chat_err']}
         
         async with mock_qolaba_api_context(responses) as mock_client:
             # Text-to-image should succeed
@@ -123,35 +133,42 @@ class TestMockStrategiesExamples:
         assert error["message"] == "Test error message"
         assert error["details"]["test_field"] == "test_value"
     
-    def test_create_mock_api_client_helper(self):
-        """Test the helper function for creating mock clients."""
-        mock_client = create_mock_api_client()
-        
+    def test_create_mock_api_client_helper(self, mock_client):
+        """Test the shared mock client built by the helper function."""
         # Verify that default methods are configured
-        assert hasattr(mock_client, 'text_to_image')
-        assert hasattr(mock_client, 'chat')
-        assert hasattr(mock_client, 'text_to_speech')
+        assert not _EXPECTED_METHODS.difference(dir(mock_client))
         
         # Test that mock responses are set up
         response = mock_client.text_to_image.return_value
         assert response.status_code == 200
     
-    def test_test_scenarios_helper(self):
+    @pytest.fixture(scope="module")
+    def scenarios(self):
+        """Scenario table from the helper, built once per module."""
+        return create_test_scenarios()
+
+    @pytest.mark.parametrize(
+        "scenario", ["success", "validation_error", "auth_error", "rate_limit", "server_error"]
+    )
+    def test_test_scenarios_helper(self, scenarios, scenario):
         """Test the test scenarios helper function."""
-        scenarios = create_test_scenarios()
-        
-        # Verify all expected scenarios are present
-        expected_scenarios = ["success", "validation_error", "auth_error", "rate_limit", "server_error"]
-        for scenario in expected_scenarios:
-            assert scenario in scenarios
-            assert "status_code" in scenarios[scenario]
-            assert "response_data" in scenarios[scenario]
-        
-        # Verify scenario data structure
+        # Verify each expected scenario is present
+        assert scenario in scenarios
+        assert "status_code" in scenarios[scenario]
+        assert "response_data" in scenarios[scenario]
+
+    def test_test_scenarios_success_data(self, scenarios):
+        """Test the success scenario data structure."""
         success_scenario = scenarios["success"]
         assert success_scenario["status_code"] == 200
         assert success_scenario["response_data"]["status"] == "completed"
 
+    def test_test_scenarios_are_shared_and_read_only(self, scenarios):
+        """Test the scenario table is built once and cannot be mutated."""
+        assert create_test_scenarios() is scenarios
+        with pytest.raises(TypeError):
+            scenarios["success"]["status_code"] = 500
+
 
 class TestMockHTTPResponse:
     """Test the MockHTTPResponse class."""
@@ -183,7 +200,6 @@ class TestMockHTTPResponse:
         response = MockHTTPResponse(200, response_data)
         
         # Text should be JSON string representation
-        import json
         expected_text = json.dumps(response_data)
         assert response.text == expected_text
 
@@ -195,15 +211,8 @@ class TestAdvancedMockScenarios:
         """Test progressive API responses (pending -> completed)."""
         from tests.utils.mock_strategies import mock_qolaba_api_progressive_responses
         
-        pending_response = MockHTTPResponse(
-            200, QolabaMockResponseGenerator.text_to_image_pending()
-        )
-        completed_response = MockHTTPResponse(
-            200, QolabaMockResponseGenerator.text_to_image_success()
-        )
-        
         with mock_qolaba_api_progressive_responses('text_to_image', 
-                                                 [pending_response, completed_response]) as mock_client:
+                                                 [_CANNED['tti_pending'], _CANNED['tti_ok']]) as mock_client:
             # First call should return pending
             first_response = await mock_client.text_to_image(prompt="Test")
             assert first_response.json()["status"] == "pending"
@@ -211,6 +220,10 @@ class TestAdvancedMockScenarios:
             # Second call should return completed
             second_response = await mock_client.text_to_image(prompt="Test")
             assert second_response.json()["status"] == "completed"
+            
+            # Further polls keep returning the final state
+            third_response = await mock_client.text_to_image(prompt="Test")
+            assert third_response.json()["status"] == "completed"
     
     async def test_streaming_chat_mock(self):
         """Test streaming chat mock functionality."""
@@ -223,44 +236,38 @@ class TestAdvancedMockScenarios:
             
             collected_messages = []
             async for chunk in stream:
-                import json
-                message_data = json.loads(chunk.decode('utf-8'))
+                message_data = json.loads(chunk)
                 if message_data.get("delta", {}).get("content"):
                     collected_messages.append(message_data["delta"]["content"])
             
             assert collected_messages == messages
     
-    def test_rate_limiter_class_directly(self):
+    async def test_rate_limiter_class_directly(self):
         """Test the MockRateLimiter class directly."""
         from tests.utils.mock_strategies import MockRateLimiter
         
         rate_limiter = MockRateLimiter(max_requests=2)
         
         # First two requests should pass
-        import asyncio
-        
-        async def run_test():
-            await rate_limiter.check_rate_limit()  # 1st request
-            await rate_limiter.check_rate_limit()  # 2nd request
-            
-            # 3rd request should raise exception
-            with pytest.raises(Exception):
-                await rate_limiter.check_rate_limit()
+        await rate_limiter.check_rate_limit()  # 1st request
+        await rate_limiter.check_rate_limit()  # 2nd request
         
-        asyncio.run(run_test())
+        # 3rd request should raise exception
+        with pytest.raises(Exception):
+            await rate_limiter.check_rate_limit()
 
 
 # Integration test with actual server components (if they exist)
 class TestMockIntegrationExamples:
     """Examples of how to use mocks with actual server components."""
     
-    @mock_qolaba_api_success(endpoint="text-to-image")
-    async def test_mcp_server_text_to_image_integration(self, mock_client):
+    @pytest.mark.parametrize("mock_client_success", [{"endpoint": "text-to-image"}], indirect=True)
+    async def test_mcp_server_text_to_image_integration(self, mock_client_success):
         """Example of testing MCP server with mocked API client."""
         # This would test the actual MCP server handlers
         # with the API client being mocked
         
-        # Mock API client is automatically configured by decorator
+        # Mock API client is automatically configured by the fixture
         # In a real integration test, you would:
         # 1. Create MCP server instance
         # 2. Call MCP handler method  
@@ -268,18 +275,13 @@ class TestMockIntegrationExamples:
         # 4. Verify MCP response format
         
         # For now, just verify the mock works as expected
-        response = await mock_client.text_to_image(prompt="Integration test")
+        response = await mock_client_success.text_to_image(prompt="Integration test")
         assert response.status_code == 200
         assert response.json()["status"] == "completed"
     
-    def test_mock_configuration_validation(self):
+    def test_mock_configuration_validation(self, mock_client):
         """Test that mocks properly handle configuration scenarios."""
         # Test different configuration scenarios that might affect API client behavior
-        mock_client = create_mock_api_client()
-        
         # Mock client should have all expected methods
-        expected_methods = ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']
-        for method_name in expected_methods:
-            assert hasattr(mock_client, method_name)
-            method = getattr(mock_client, method_name)
-            assert callable(method)
\ No newline at end of file
+        assert not _EXPECTED_METHODS.difference(dir(mock_client))
+        assert all(callable(getattr(mock_client, name)) for name in _EXPECTED_METHODS)
\ No newline at end of file
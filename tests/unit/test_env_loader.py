@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from qolaba_mcp_server.utils import env_loader
+
+
+@pytest.fixture(autouse=True)
+def _fresh_env_cache():
+    env_loader.invalidate_env_cache()
+    yield
+    env_loader.invalidate_env_cache()
+
+
+def test_get_env_var_is_memoized_until_invalidated(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("QOLABA_TEST_VAR", "first")
+    assert env_loader.get_env_var("QOLABA_TEST_VAR") == "first"
+
+    monkeypatch.setenv("QOLABA_TEST_VAR", "second")
+    assert env_loader.get_env_var("QOLABA_TEST_VAR") == "first"
+
+    env_loader.invalidate_env_cache("QOLABA_TEST_VAR")
+    assert env_loader.get_env_var("QOLABA_TEST_VAR") == "second"
+
+
+def test_get_env_var_default_and_required(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("QOLABA_TEST_MISSING", raising=False)
+
+    assert env_loader.get_env_var("QOLABA_TEST_MISSING", default="fallback") == "fallback"
+    with pytest.raises(ValueError):
+        env_loader.get_env_var("QOLABA_TEST_MISSING", required=True)
+
+
+def test_load_environment_invalidates_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.delenv("QOLABA_TEST_DOTENV", raising=False)
+    assert env_loader.get_env_var("QOLABA_TEST_DOTENV") is None
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("QOLABA_TEST_DOTENV=loaded\n")
+    try:
+        assert env_loader.load_environment(env_file) is True
+        assert env_loader.get_env_var("QOLABA_TEST_DOTENV") == "loaded"
+    finally:
+        os.environ.pop("QOLABA_TEST_DOTENV", None)
+
+
+def test_typed_getters_parse_values(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("QOLABA_TEST_BOOL", "Yes")
+    monkeypatch.setenv("QOLABA_TEST_INT", "42")
+    monkeypatch.setenv("QOLABA_TEST_FLOAT", "not-a-number")
+
+    assert env_loader.get_env_bool("QOLABA_TEST_BOOL") is True
+    assert env_loader.get_env_int("QOLABA_TEST_INT", default=1) == 42
+    assert env_loader.get_env_float("QOLABA_TEST_FLOAT", default=2.5) == 2.5
+    assert env_loader.get_env_float("QOLABA_TEST_FLOAT", default=3.5) == 3.5
+
+
+def test_load_environment_keeps_existing_values(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setenv("QOLABA_TEST_EXISTING", "from-process")
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("QOLABA_TEST_EXISTING=from-file\n")
+
+    assert env_loader.load_environment(env_file) is True
+    assert env_loader.get_env_var("QOLABA_TEST_EXISTING") == "from-process"
+    assert env_loader.load_environment(tmp_path / "missing.env") is False
+
+
+def test_load_environment_reports_empty_file_as_found(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("")
+
+    assert env_loader.load_environment(env_file) is True
+
+
+def test_validate_required_env_vars_rejects_placeholders(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("QOLABA_API_KEY", "change_me")
+    with pytest.raises(ValueError, match="placeholder"):
+        env_loader.validate_required_env_vars()
+
+    monkeypatch.setenv("QOLABA_API_KEY", "real-key")
+    env_loader.invalidate_env_cache("QOLABA_API_KEY")
+    env_loader.validate_required_env_vars()
@@ -112,6 +112,9 @@ class TestQolabaHTTPClient:
             assert isinstance(call_kwargs['timeout'], httpx.Timeout)
             assert call_kwargs['verify'] == api_key_settings.verify_ssl
             assert isinstance(call_kwargs['limits'], httpx.Limits)
+            assert call_kwargs['limits'].max_connections == (
+                api_key_settings.max_concurrency + api_key_settings.max_status_concurrency
+            )
     
     @pytest.mark.asyncio
     async def test_ensure_client_with_proxies(self):
@@ -499,6 +502,26 @@ class TestHTTPResponse:
         assert response.response_time_ms is None
 
 
+class TestQolabaHTTPClientMockTransport:
+    """End-to-end requests through the shared ``mock_transport`` fixture."""
+    
+    @pytest.mark.asyncio
+    async def test_post_returns_canned_endpoint_response(self, qolaba_http_client, mock_qolaba_api_responses):
+        """Test a POST is routed to the canned response for its endpoint."""
+        response = await qolaba_http_client.post("text-to-image", json={"prompt": "test"})
+        
+        assert response.status_code == 200
+        assert response.content == mock_qolaba_api_responses["text-to-image"]["success"]["json"]
+    
+    @pytest.mark.asyncio
+    async def test_task_status_routes_by_endpoint(self, qolaba_http_client):
+        """Test task-status requests route on the endpoint, not the task id."""
+        response = await qolaba_http_client.get("task-status/task_12345")
+        
+        assert response.status_code == 200
+        assert response.content["status"] == "completed"
+
+
 class TestHTTPClientExceptions:
     """Test cases for HTTP client exceptions."""
     
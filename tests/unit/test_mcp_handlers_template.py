@@ -6,6 +6,7 @@ command handlers, request validation, response serialization, and integration
 with the Qolaba API client.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import json
@@ -117,6 +118,15 @@ class TestTextToImageHandler:
 class TestChatHandler:
     """Test template for chat MCP handler."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_chat_cache(self):
+        """Start and finish each test without cached chat replies."""
+        from qolaba_mcp_server import server
+
+        server._CHAT_CACHE.clear()
+        yield
+        server._CHAT_CACHE.clear()
+
     @pytest.mark.asyncio
     async def test_chat_success(
         self,
@@ -125,16 +135,68 @@ class TestChatHandler:
         sample_chat_response
     ):
         """Test successful chat completion via MCP."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+        
         # Arrange
-        mock_qolaba_client.chat.return_value = sample_chat_response
+        mock_qolaba_client.post.return_value = HTTPResponse(
+            status_code=200, headers={}, content=sample_chat_response
+        )
+        
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            result = await server.chat.fn(None, message="Hello, how are you?")
+            
+            assert result["success"] is True
+            assert result["task_id"] == "chat_67890"
+            assert result["status"] == "completed"
+            
+            # Non-deterministic requests always reach the API
+            await server.chat.fn(None, message="Hello, how are you?")
+            assert mock_qolaba_client.post.await_count == 2
+
+    def test_chat_default_body_matches_validated_request(self):
+        """Test that the default-parameter fast path serializes like ChatRequest."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.mcp.validation import validate_chat_request
+
+        message = 'Quote " and ümlaut\nnext line'
+        validated = validate_chat_request(message=message).data
+
+        assert server._default_chat_body(message) == server._dump_request(validated)
 
-        # TODO: Implement test when MCP handlers are ready
-        # with patch('qolaba_mcp_server.api.get_client', return_value=mock_qolaba_client):
-        #     result = await chat_handler(sample_chat_request)
-        #     
-        #     assert result["task_id"] == "chat_67890"
-        #     assert result["status"] == "completed"
-        #     assert "choices" in result["result"]
+    @pytest.mark.asyncio
+    async def test_chat_caches_deterministic_requests(
+        self,
+        mock_qolaba_client,
+        sample_chat_response
+    ):
+        """Test identical temperature-0 chat requests share one API call."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+        
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return HTTPResponse(status_code=200, headers={}, content=sample_chat_response)
+        
+        mock_qolaba_client.post.side_effect = slow_post
+        
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            results = await asyncio.gather(*(
+                server.chat.fn(None, message="Hi", temperature=0.0) for _ in range(3)
+            ))
+            again = await server.chat.fn(None, message="Hi", temperature=0.0)
+            
+            assert mock_qolaba_client.post.await_count == 1
+            assert all(result == again for result in results)
+            
+            # Replies are copies, so mutating one leaves the cached entry intact
+            results[0]["content"] = "mutated"
+            assert await server.chat.fn(None, message="Hi", temperature=0.0) == again
+            
+            # Opting in caches non-zero temperatures too
+            await server.chat.fn(None, message="Hi", cache_response=True)
+            await server.chat.fn(None, message="Hi", cache_response=True)
+            assert mock_qolaba_client.post.await_count == 2
 
     @pytest.mark.asyncio
     async def test_chat_empty_messages(
@@ -142,12 +204,14 @@ class TestChatHandler:
         mock_qolaba_client
     ):
         """Test chat handler with empty messages."""
-        # TODO: Implement test when MCP handlers are ready
-        # invalid_request = {"messages": []}
-        # 
-        # with patch('qolaba_mcp_server.api.get_client', return_value=mock_qolaba_client):
-        #     with pytest.raises(ValidationException):
-        #         await chat_handler(invalid_request)
+        from qolaba_mcp_server import server
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            result = await server.chat.fn(None, message="   ")
+
+        assert result["success"] is False
+        assert result["error"] == "validation_error"
+        mock_qolaba_client.post.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_chat_streaming(
@@ -162,14 +226,58 @@ class TestChatHandler:
 
     def test_chat_message_validation(self):
         """Test chat message format validation."""
-        # TODO: Implement test when MCP handlers are ready
-        # Test validation of message roles, content, etc.
-        pass
+        from qolaba_mcp_server.mcp.validation import (
+            format_validation_error,
+            validate_chat_request,
+            validate_vector_store_request,
+        )
+        
+        result = validate_chat_request(message="Hi", system_message="Be brief", temperature=0)
+        assert result.success
+        assert [m.role for m in result.data.messages] == ["system", "user"]
+        
+        # Blank messages and out-of-range values are rejected before the model is built
+        for kwargs in (
+            {"message": ""},
+            {"message": " \n\t"},
+            {"temperature": -1},
+            {"temperature": 2.5},
+            {"max_tokens": 0},
+        ):
+            kwargs = {"message": "Hi", **kwargs}
+            with patch("qolaba_mcp_server.mcp.validation.validate_request_data") as mock_validate:
+                result = validate_chat_request(**kwargs)
+            assert not result.success
+            assert "ChatRequest" in result.error
+            mock_validate.assert_not_called()
+            
+            # Known rejections map to prebuilt responses; callers get a copy
+            response = format_validation_error(result)
+            assert response["message"] == result.error
+            response["message"] = "mutated"
+            assert format_validation_error(result)["message"] == result.error
+        
+        assert validate_vector_store_request("https://example.com/a.pdf", "docs").success
+        assert not validate_vector_store_request(
+            "https://example.com/a.pdf", "docs", chunk_size=500, chunk_overlap=500
+        ).success
+        assert not validate_vector_store_request(
+            "https://example.com/a.pdf", "docs", chunk_size=50
+        ).success
 
 
 class TestTaskStatusHandler:
     """Test template for task status MCP handler."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_task_cache(self):
+        """Start and finish each test without cached task statuses."""
+        from qolaba_mcp_server import server
+
+        server._TASK_CACHE.clear()
+        yield
+        server._TASK_CACHE.clear()
+
     @pytest.mark.asyncio
     async def test_get_task_status_success(
         self,
@@ -184,15 +292,115 @@ class TestTaskStatusHandler:
             "progress": 100.0,
             "result": {"image_url": "https://example.com/image.jpg"}
         }
-        mock_qolaba_client.get_task_status.return_value = expected_response
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+        
+        mock_qolaba_client.get.return_value = HTTPResponse(
+            status_code=200, headers={}, content=expected_response
+        )
+        
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            result = await server.get_task_status.fn(None, task_id=task_id)
+            
+            assert result["task_id"] == task_id
+            assert result["status"] == "completed"
+            assert result["progress"] == 100.0
+            
+            # Completed tasks are answered from the cache on later polls
+            assert await server.get_task_status.fn(None, task_id=task_id) == result
+            mock_qolaba_client.get.assert_awaited_once_with(f"task-status/{task_id}")
 
-        # TODO: Implement test when MCP handlers are ready
-        # with patch('qolaba_mcp_server.api.get_client', return_value=mock_qolaba_client):
-        #     result = await get_task_status_handler({"task_id": task_id})
-        #     
-        #     assert result["task_id"] == task_id
-        #     assert result["status"] == "completed"
-        #     assert result["progress"] == 100.0
+    @pytest.mark.asyncio
+    async def test_get_task_status_results_do_not_share_nested_objects(
+        self,
+        mock_qolaba_client
+    ):
+        """Test that mutating a returned status leaves the cache and other callers intact."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+
+        mock_qolaba_client.get.return_value = HTTPResponse(
+            status_code=200,
+            headers={},
+            content={"status": "completed", "result": {"image_url": "https://example.com/a.jpg"}}
+        )
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            first, second = await asyncio.gather(
+                server.get_task_status.fn(None, task_id="task_alias"),
+                server.get_task_status.fn(None, task_id="task_alias")
+            )
+            first["result"]["image_url"] = "mutated"
+
+            cached = await server.get_task_status.fn(None, task_id="task_alias")
+
+        assert second["result"]["image_url"] == "https://example.com/a.jpg"
+        assert cached["result"]["image_url"] == "https://example.com/a.jpg"
+
+    @pytest.mark.asyncio
+    async def test_get_task_status_deduplicates_concurrent_polls(
+        self,
+        mock_qolaba_client
+    ):
+        """Test that concurrent polls for one task share a single upstream call."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return HTTPResponse(status_code=200, headers={}, content={"status": "in_progress"})
+
+        mock_qolaba_client.get.side_effect = slow_get
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            results = await asyncio.gather(
+                *(server.get_task_status.fn(None, task_id="task_shared") for _ in range(5))
+            )
+
+        assert all(result["status"] == "in_progress" for result in results)
+        assert mock_qolaba_client.get.await_count == 1
+        assert not server._task_status_inflight
+
+    @pytest.mark.asyncio
+    async def test_get_task_status_unknown_status_is_pending(
+        self,
+        mock_qolaba_client
+    ):
+        """Test that unrecognised upstream statuses are pending and only cached briefly."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+
+        mock_qolaba_client.get.return_value = HTTPResponse(
+            status_code=200, headers={}, content={"status": "queued"}
+        )
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)), \
+                patch.object(server, "_PENDING_TASK_TTL", 0.0):
+            result = await server.get_task_status.fn(None, task_id="task_queued")
+            await server.get_task_status.fn(None, task_id="task_queued")
+
+        assert result["status"] == "pending"
+        assert mock_qolaba_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_task_status_cancelled_is_terminal(
+        self,
+        mock_qolaba_client
+    ):
+        """Test that cancelled tasks are reported as such and cached as finished."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPResponse
+
+        mock_qolaba_client.get.return_value = HTTPResponse(
+            status_code=200, headers={}, content={"status": "cancelled"}
+        )
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            result = await server.get_task_status.fn(None, task_id="task_cancelled")
+            assert await server.get_task_status.fn(None, task_id="task_cancelled") == result
+
+        assert result["status"] == "cancelled"
+        mock_qolaba_client.get.assert_awaited_once_with("task-status/task_cancelled")
 
     @pytest.mark.asyncio
     async def test_get_task_status_not_found(
@@ -223,6 +431,51 @@ class TestTaskStatusHandler:
         pass
 
 
+class TestAvailableModelsHandler:
+    """Test the cached model catalogue tool."""
+
+    @pytest.mark.asyncio
+    async def test_list_available_models_returns_independent_copies(self):
+        """Test that mutating one result does not leak into later calls."""
+        from qolaba_mcp_server import server
+
+        first = await server.list_available_models.fn(None)
+        first["content"]["models"]["chat"].append("injected-model")
+
+        second = await server.list_available_models.fn(None)
+
+        assert "injected-model" not in second["content"]["models"]["chat"]
+        assert second["content"] == server._available_models_response()["content"]
+
+
+class TestServerHealthHandler:
+    """Test the server health tool."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_health_cache(self):
+        """Start and finish each test without a cached health probe."""
+        from qolaba_mcp_server import server
+
+        server._HEALTH_CACHE.clear()
+        yield
+        server._HEALTH_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_server_health_probe_is_cached(self, mock_qolaba_client):
+        """Test concurrent and repeated health checks share one upstream probe."""
+        from qolaba_mcp_server import server
+        from qolaba_mcp_server.api.client import HTTPClientError
+
+        mock_qolaba_client.get.side_effect = HTTPClientError("Not found", status_code=404)
+
+        with patch.object(server, "_get_client", AsyncMock(return_value=mock_qolaba_client)):
+            results = await asyncio.gather(*(server.server_health.fn(None) for _ in range(3)))
+            results.append(await server.server_health.fn(None))
+
+        assert all(result["status"] == "healthy" for result in results)
+        mock_qolaba_client.get.assert_awaited_once_with("task-status/health-check-test")
+
+
 class TestMCPServerIntegration:
     """Test template for MCP server integration."""
 
@@ -356,4 +609,4 @@ class TestMCPPerformance:
     def test_response_times(self):
         """Test MCP handler response times."""
         # TODO: Implement performance test
-        pass
\ No newline at end of file
+        pass
@@ -17,12 +17,23 @@ from qolaba_mcp_server.models.api_models import (
     ChatRequest,
     ChatMessage,
     TaskStatusResponse,
+    TextToSpeechRequest,
+    VectorStoreRequest,
     QolabaException,
     ValidationException,
     create_error_from_http_status,
+    create_batch_error_response,
+    is_retryable_error,
+    format_error_for_logging,
     validate_image_data,
     convert_image_to_base64,
-    normalize_model_name
+    normalize_model_name,
+    validate_audio_format,
+    validate_color_value,
+    convert_file_size_to_bytes,
+    convert_duration_to_seconds,
+    validate_url_or_path,
+    validate_json_schema,
 )
 
 
@@ -191,6 +202,27 @@ class TestChatRequest:
         assert request.temperature == 1.0
 
 
+class TestTextAndCollectionValidation:
+    """Test template for text and collection name validators."""
+
+    def test_text_length_checked_after_strip(self):
+        """Test surrounding whitespace does not count towards the text limit."""
+        request = TextToSpeechRequest(text="  " + "a" * 4000 + "  ")
+        assert request.text == "a" * 4000
+        
+        with pytest.raises(ValidationError) as exc_info:
+            TextToSpeechRequest(text="   ")
+        assert "Text cannot be empty" in str(exc_info.value)
+
+    def test_collection_name_stripped(self):
+        """Test collection names are stripped and validated once."""
+        request = VectorStoreRequest(file="doc.pdf", collection_name=" my_docs-1 ")
+        assert request.collection_name == "my_docs-1"
+        
+        with pytest.raises(ValidationError):
+            VectorStoreRequest(file="doc.pdf", collection_name="bad name")
+
+
 class TestTaskStatusResponse:
     """Test template for TaskStatusResponse model."""
 
@@ -300,6 +332,14 @@ class TestExceptionHandling:
         assert error_dict["error_code"] == "TEST_ERROR"
         assert error_dict["details"]["key"] == "value"
 
+    def test_format_error_for_logging(self):
+        """Test logging format adds the exception type to the dict fields."""
+        exception = ValidationException(message="Invalid field", field="prompt")
+        
+        log_data = format_error_for_logging(exception)
+        
+        assert log_data == {**exception.to_dict(), "exception_type": "ValidationException"}
+
     def test_exception_to_detailed_error(self):
         """Test exception conversion to DetailedQolabaError model."""
         exception = QolabaException(
@@ -313,6 +353,39 @@ class TestExceptionHandling:
         assert detailed_error.error_code == "TEST_ERROR"
         assert detailed_error.timestamp is not None
 
+    def test_create_batch_error_response(self):
+        """Test batch error response shares one timestamp across errors."""
+        errors = [
+            QolabaException(message="First error", error_code="FIRST"),
+            ValidationException(message="Second error", field="prompt"),
+        ]
+        
+        batch = create_batch_error_response(5, errors)
+        
+        assert batch.failed_items == 2
+        assert batch.successful_items == 3
+        assert batch.partial_success is True
+        assert [e.error_code for e in batch.errors] == ["FIRST", "VALIDATION_ERROR"]
+        assert batch.errors[1].details["field"] == "prompt"
+        assert batch.errors[0].timestamp.endswith("Z")
+        assert batch.errors[0].timestamp == batch.errors[1].timestamp
+
+    def test_create_batch_error_response_rejects_invalid_category(self):
+        """Test batch error response still validates exception attributes."""
+        errors = [QolabaException(message="Odd error", category="not-a-category")]
+        
+        with pytest.raises(ValidationError):
+            create_batch_error_response(1, errors)
+
+    def test_is_retryable_error(self):
+        """Test retry classification by category and HTTP status."""
+        assert is_retryable_error(create_error_from_http_status(503)) is True
+        assert is_retryable_error(create_error_from_http_status(429)) is True
+        assert is_retryable_error(create_error_from_http_status(401)) is False
+        assert is_retryable_error(ValidationException(message="Bad input")) is False
+        assert is_retryable_error(QolabaException(message="Gateway", http_status=504)) is True
+        assert is_retryable_error(QolabaException(message="Not found", http_status=404)) is False
+
 
 class TestDataConversionUtilities:
     """Test template for data conversion and validation utilities."""
@@ -325,13 +398,82 @@ class TestDataConversionUtilities:
 
     def test_validate_image_data_base64(self):
         """Test image data validation with base64."""
-        # TODO: Implement when validate_image_data is available
-        pass
+        import base64
+        
+        raw = base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32).decode("ascii")
+        assert validate_image_data(raw) is True
+        assert validate_image_data("data:image/png;base64," + raw) is True
+        assert validate_image_data(raw[:-1]) is False  # Truncated payload
+        assert validate_image_data("not base64!") is False
+        assert validate_image_data("https://not a url") is False
 
     def test_convert_image_to_base64(self):
         """Test image to base64 conversion."""
-        # TODO: Implement when convert_image_to_base64 is available
-        pass
+        import base64
+        
+        png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        encoded = base64.b64encode(png_bytes).decode("ascii")
+        
+        assert convert_image_to_base64(png_bytes) == f"data:image/png;base64,{encoded}"
+        assert convert_image_to_base64(encoded) == f"data:image/png;base64,{encoded}"
+        
+        data_uri = f"data:image/png;base64,{encoded}"
+        assert convert_image_to_base64(data_uri) is data_uri
+
+    def test_convert_image_to_base64_from_file(self, tmp_path):
+        """Test image conversion from a local file path."""
+        image_file = tmp_path / "image.gif"
+        image_file.write_bytes(b"GIF87a" + b"\x00" * 8)
+        
+        result = convert_image_to_base64(str(image_file))
+        
+        assert result == "data:image/gif;base64,R0lGODdhAAAAAAAAAAA="
+        
+        empty_file = tmp_path / "empty.png"
+        empty_file.write_bytes(b"")
+        assert convert_image_to_base64(str(empty_file)) == "data:image/jpeg;base64,"
+
+    def test_convert_image_to_base64_skips_stat_for_payloads(self):
+        """Test long or line-wrapped base64 input is never probed as a file path."""
+        import base64
+        from unittest.mock import patch
+        
+        png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+        encoded = base64.b64encode(png_bytes).decode("ascii")
+        wrapped = base64.encodebytes(png_bytes[:48]).decode("ascii")
+        
+        with patch("qolaba_mcp_server.models.api_models.os.path.exists") as mock_exists:
+            assert convert_image_to_base64(encoded) == f"data:image/png;base64,{encoded}"
+            assert convert_image_to_base64(wrapped).startswith("data:image/png;base64,")
+        mock_exists.assert_not_called()
+
+    def test_convert_image_to_base64_from_url(self):
+        """Test image download is read into one buffer, with and without Content-Length."""
+        import io
+        from unittest.mock import MagicMock, patch
+        
+        png_bytes = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 8
+        expected = convert_image_to_base64(png_bytes)
+        
+        sized = MagicMock(headers={"Content-Length": str(len(png_bytes))}, raw=io.BytesIO(png_bytes))
+        sized.__enter__.return_value = sized
+        unsized = MagicMock(headers={"Content-Encoding": "gzip"})
+        unsized.__enter__.return_value = unsized
+        unsized.iter_content.return_value = iter([png_bytes[:100], png_bytes[100:]])
+        
+        for response in (sized, unsized):
+            with patch("requests.get", return_value=response) as mock_get:
+                assert convert_image_to_base64("https://example.com/image.png") == expected
+            mock_get.assert_called_once_with("https://example.com/image.png", stream=True, timeout=30)
+            response.raise_for_status.assert_called_once()
+
+    def test_convert_image_to_base64_mime_detection(self):
+        """Test MIME type detection from image magic bytes."""
+        assert convert_image_to_base64(b"\xff\xd8\xff\xe0").startswith("data:image/jpeg;")
+        assert convert_image_to_base64(b"GIF89a" + b"\x00" * 4).startswith("data:image/gif;")
+        assert convert_image_to_base64(b"RIFF\x00\x00\x00\x00WEBPVP8 ").startswith("data:image/webp;")
+        # Unknown signatures fall back to JPEG
+        assert convert_image_to_base64(b"\x00\x01\x02").startswith("data:image/jpeg;")
 
     def test_normalize_model_name(self):
         """Test model name normalization."""
@@ -339,6 +481,77 @@ class TestDataConversionUtilities:
         assert normalize_model_name("Stable-Diffusion", "image") == "stable-diffusion"
         assert normalize_model_name("  GPT-4  ", "text") == "gpt-4"
 
+    def test_validate_audio_format(self):
+        """Test audio format normalization, including repeated (cached) lookups."""
+        assert validate_audio_format("MPEG") == "mp3"
+        assert validate_audio_format("MPEG") == "mp3"
+        
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unsupported audio format 'midi'"):
+                validate_audio_format("midi")
+
+    def test_validate_color_value(self):
+        """Test color normalization for hex, named and RGB inputs."""
+        assert validate_color_value("#a1b2c3") == "#A1B2C3"
+        assert validate_color_value("A1B2C3") == "#A1B2C3"
+        assert validate_color_value("#abc") == "#AABBCC"
+        assert validate_color_value("F0a") == "#FF00AA"
+        assert validate_color_value(" fff ") == "#FFFFFF"
+        assert validate_color_value("Red") == "#FF0000"
+        assert validate_color_value((255, 128, 0)) == "#FF8000"
+        assert validate_color_value([0, 15, 16, 0.5]) == "#000F10"
+        
+        with pytest.raises(ValueError):
+            validate_color_value("#abcd")
+        with pytest.raises(ValueError):
+            validate_color_value("##abc")
+        with pytest.raises(ValueError):
+            validate_color_value("#ab  cd")
+        with pytest.raises(ValueError):
+            validate_color_value("#a1b2g3")
+        with pytest.raises(ValueError):
+            validate_color_value((256, 0, 0))
+        with pytest.raises(ValueError):
+            validate_color_value((0, 0, 0, 2))
+
+    def test_size_and_duration_conversion(self):
+        """Test file size and duration string parsing."""
+        assert convert_file_size_to_bytes("1.5 MB") == 1572864
+        assert convert_file_size_to_bytes("500kb") == 512000
+        assert convert_duration_to_seconds("1.5m") == 90.0
+        assert convert_duration_to_seconds("1:30") == 90.0
+        
+        with pytest.raises(ValueError):
+            convert_file_size_to_bytes("ten megs")
+
+    def test_validate_url_or_path(self, tmp_path):
+        """Test URL validation and local path handling."""
+        assert validate_url_or_path(" https://cdn.example.com/a.png?x=1 ") == "https://cdn.example.com/a.png?x=1"
+        assert validate_url_or_path("http://localhost:8000/img") == "http://localhost:8000/img"
+        
+        target = tmp_path / "image.png"
+        target.write_bytes(b"")
+        link = tmp_path / "link.png"
+        link.symlink_to(target)
+        assert validate_url_or_path(str(link), allow_local=True) == str(link)
+        assert validate_url_or_path(str(link), allow_local=True, resolve_symlinks=True) == str(target.resolve())
+        
+        with pytest.raises(ValueError):
+            validate_url_or_path("http://")
+        with pytest.raises(ValueError):
+            validate_url_or_path("relative/path.png")
+
+    def test_validate_json_schema(self):
+        """Test required field checks and removal of empty values."""
+        data = {"prompt": "cat", "seed": None, "negative_prompt": "", "steps": 0}
+        
+        assert validate_json_schema(data, ["prompt"]) == {"prompt": "cat", "steps": 0}
+        
+        with pytest.raises(ValueError, match="Missing required fields: model, width"):
+            validate_json_schema(data, ["model", "prompt", "width"])
+        with pytest.raises(ValueError):
+            validate_json_schema(["prompt"])
+
     def test_model_serialization(self):
         """Test model JSON serialization."""
         request = TextToImageRequest(
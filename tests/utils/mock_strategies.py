@@ -4,15 +4,22 @@ Mock strategies for external API calls using unittest.mock.
 This module provides comprehensive mocking strategies for the Qolaba API client,
 including mock decorators, response generators, error handlers, and context managers.
 It follows the requirements from TEST-002 to enable testing without external dependencies.
+
+The decorators pass their mock as the ``mock_client`` keyword argument, replacing
+the ``mock_client`` fixture from ``tests/conftest.py`` that pytest injects for it.
+Prefer the ``mock_client`` / ``mock_client_success`` fixtures in new tests: they
+reuse one session-wide mock graph instead of building a new one per test.
 """
 
 import json
 import asyncio
+import itertools
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union, Callable, AsyncGenerator
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, Callable, AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 from contextlib import asynccontextmanager, contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 import uuid
 
 import httpx
@@ -36,6 +43,12 @@ class QolabaMockResponseGenerator:
         """Generate ISO timestamp for mock responses."""
         return datetime.now(timezone.utc).isoformat()
     
+    @classmethod
+    def _task_timestamps(cls) -> Dict[str, str]:
+        """created_at/updated_at pair for a freshly generated task (one clock read)."""
+        timestamp = cls.generate_timestamp()
+        return {"created_at": timestamp, "updated_at": timestamp}
+    
     @classmethod
     def text_to_image_success(cls, task_id: str = None, **kwargs) -> Dict[str, Any]:
         """Generate successful text-to-image response."""
@@ -53,8 +66,7 @@ class QolabaMockResponseGenerator:
                     "seed": kwargs.get("seed", 42)
                 }
             },
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
     
     @classmethod
@@ -64,8 +76,7 @@ class QolabaMockResponseGenerator:
         return {
             "task_id": task_id,
             "status": "pending",
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
     
     @classmethod
@@ -83,8 +94,7 @@ class QolabaMockResponseGenerator:
                     "steps": kwargs.get("steps", 20)
                 }
             },
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
     
     @classmethod
@@ -102,8 +112,7 @@ class QolabaMockResponseGenerator:
                     "duration": kwargs.get("duration", 12.5)
                 }
             },
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
     
     @classmethod
@@ -127,8 +136,7 @@ class QolabaMockResponseGenerator:
                     "total_tokens": kwargs.get("total_tokens", 25)
                 }
             },
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
     
     @classmethod
@@ -139,8 +147,7 @@ class QolabaMockResponseGenerator:
             "task_id": task_id,
             "status": status,
             "progress": progress,
-            "created_at": cls.generate_timestamp(),
-            "updated_at": cls.generate_timestamp()
+            **cls._task_timestamps()
         }
         
         if result:
@@ -164,6 +171,28 @@ class QolabaMockResponseGenerator:
         }
 
 
+# =============================================================================
+# Mock API Client Spec
+# =============================================================================
+
+class _QolabaAPISpec:
+    """Endpoint surface of the mocked Qolaba API client.
+
+    Used as the ``spec`` of the async client mocks so that only these methods
+    exist (typos raise ``AttributeError``) and each resolves to an ``AsyncMock``.
+    """
+
+    async def text_to_image(self, **kwargs): ...
+    async def image_to_image(self, **kwargs): ...
+    async def inpainting(self, **kwargs): ...
+    async def replace_background(self, **kwargs): ...
+    async def text_to_speech(self, **kwargs): ...
+    async def chat(self, **kwargs): ...
+    async def stream_chat(self, **kwargs): ...
+    async def store_in_vector_db(self, **kwargs): ...
+    async def get_task_status(self, task_id: str): ...
+
+
 # =============================================================================
 # Mock HTTP Response Classes
 # =============================================================================
@@ -171,12 +200,15 @@ class QolabaMockResponseGenerator:
 class MockHTTPResponse:
     """Mock HTTP response for testing."""
     
+    __slots__ = ("status_code", "_json_data", "headers", "_text")
+    
     def __init__(self, status_code: int = 200, json_data: Dict[str, Any] = None, 
                  headers: Dict[str, str] = None, text: str = None):
         self.status_code = status_code
         self._json_data = json_data or {}
         self.headers = headers or {"content-type": "application/json"}
-        self._text = text or json.dumps(self._json_data)
+        # Serialized on first access; most tests only ever call json()
+        self._text = text or None
         
     def json(self) -> Dict[str, Any]:
         """Return JSON response data."""
@@ -185,6 +217,8 @@ class MockHTTPResponse:
     @property
     def text(self) -> str:
         """Return response text."""
+        if self._text is None:
+            self._text = json.dumps(self._json_data)
         return self._text
     
     def raise_for_status(self):
@@ -214,7 +248,7 @@ def mock_qolaba_api_success(endpoint: str = "all", **response_kwargs):
         async def async_wrapper(*args, **kwargs):
             with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
                 # Configure successful responses based on endpoint
-                mock_instance = AsyncMock()
+                mock_instance = AsyncMock(spec=_QolabaAPISpec)
                 mock_client.return_value = mock_instance
                 
                 if endpoint == "text-to-image" or endpoint == "all":
@@ -237,7 +271,7 @@ def mock_qolaba_api_success(endpoint: str = "all", **response_kwargs):
                         200, QolabaMockResponseGenerator.chat_success(**response_kwargs)
                     )
                 
-                return await test_func(*args, mock_client=mock_instance, **kwargs)
+                return await test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         @wraps(test_func)
         def sync_wrapper(*args, **kwargs):
@@ -251,7 +285,7 @@ def mock_qolaba_api_success(endpoint: str = "all", **response_kwargs):
                         200, QolabaMockResponseGenerator.text_to_image_success(**response_kwargs)
                     )
                 
-                return test_func(*args, mock_client=mock_instance, **kwargs)
+                return test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         # Return appropriate wrapper based on function type
         return async_wrapper if asyncio.iscoroutinefunction(test_func) else sync_wrapper
@@ -278,7 +312,7 @@ def mock_qolaba_api_error(status_code: int = 400, error_code: str = "VALIDATION_
             )
             
             with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-                mock_instance = AsyncMock()
+                mock_instance = AsyncMock(spec=_QolabaAPISpec)
                 mock_client.return_value = mock_instance
                 
                 # Configure all methods to return error
@@ -287,7 +321,7 @@ def mock_qolaba_api_error(status_code: int = 400, error_code: str = "VALIDATION_
                         status_code, error_response
                     )
                 
-                return await test_func(*args, mock_client=mock_instance, **kwargs)
+                return await test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         @wraps(test_func)  
         def sync_wrapper(*args, **kwargs):
@@ -305,7 +339,7 @@ def mock_qolaba_api_error(status_code: int = 400, error_code: str = "VALIDATION_
                         status_code, error_response
                     )
                 
-                return test_func(*args, mock_client=mock_instance, **kwargs)
+                return test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         return async_wrapper if asyncio.iscoroutinefunction(test_func) else sync_wrapper
     
@@ -323,7 +357,7 @@ def mock_qolaba_api_timeout(timeout_duration: float = 5.0):
         @wraps(test_func)
         async def async_wrapper(*args, **kwargs):
             with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-                mock_instance = AsyncMock()
+                mock_instance = AsyncMock(spec=_QolabaAPISpec)
                 mock_client.return_value = mock_instance
                 
                 # Configure all methods to raise timeout
@@ -331,7 +365,7 @@ def mock_qolaba_api_timeout(timeout_duration: float = 5.0):
                 for method in ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']:
                     getattr(mock_instance, method).side_effect = timeout_error
                 
-                return await test_func(*args, mock_client=mock_instance, **kwargs)
+                return await test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         @wraps(test_func)
         def sync_wrapper(*args, **kwargs):
@@ -343,7 +377,7 @@ def mock_qolaba_api_timeout(timeout_duration: float = 5.0):
                 for method in ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']:
                     getattr(mock_instance, method).side_effect = timeout_error
                 
-                return test_func(*args, mock_client=mock_instance, **kwargs)
+                return test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         return async_wrapper if asyncio.iscoroutinefunction(test_func) else sync_wrapper
     
@@ -370,7 +404,7 @@ async def mock_qolaba_api_context(responses: Dict[str, MockHTTPResponse]):
             # Test code here
     """
     with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-        mock_instance = AsyncMock()
+        mock_instance = AsyncMock(spec=_QolabaAPISpec)
         mock_client.return_value = mock_instance
         
         # Configure specific responses for each method
@@ -386,6 +420,9 @@ def mock_qolaba_api_progressive_responses(method: str, responses: List[MockHTTPR
     """
     Context manager for progressive API responses (e.g., pending -> completed).
     
+    Once the sequence is exhausted, further calls keep returning the last
+    response, so polling loops settle on the final state.
+    
     Args:
         method: API method name to mock
         responses: List of responses to return in sequence
@@ -398,12 +435,14 @@ def mock_qolaba_api_progressive_responses(method: str, responses: List[MockHTTPR
             # First call returns pending, second returns completed
     """
     with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-        mock_instance = AsyncMock()
+        mock_instance = AsyncMock(spec=_QolabaAPISpec)
         mock_client.return_value = mock_instance
         
-        # Configure method to return responses in sequence
-        if hasattr(mock_instance, method):
-            getattr(mock_instance, method).side_effect = responses
+        # Configure method to return responses in sequence, then repeat the last
+        if hasattr(mock_instance, method) and responses:
+            getattr(mock_instance, method).side_effect = itertools.chain(
+                responses, itertools.repeat(responses[-1])
+            )
         
         yield mock_instance
 
@@ -415,6 +454,8 @@ def mock_qolaba_api_progressive_responses(method: str, responses: List[MockHTTPR
 class MockRateLimiter:
     """Mock rate limiter for testing rate limiting scenarios."""
     
+    __slots__ = ("max_requests", "time_window", "request_count")
+    
     def __init__(self, max_requests: int = 5, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
@@ -448,7 +489,7 @@ def mock_qolaba_api_rate_limited(max_requests: int = 3):
             rate_limiter = MockRateLimiter(max_requests)
             
             with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-                mock_instance = AsyncMock()
+                mock_instance = AsyncMock(spec=_QolabaAPISpec)
                 mock_client.return_value = mock_instance
                 
                 # Configure methods to check rate limit
@@ -459,7 +500,7 @@ def mock_qolaba_api_rate_limited(max_requests: int = 3):
                 for method in ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']:
                     getattr(mock_instance, method).side_effect = rate_limited_call
                 
-                return await test_func(*args, mock_client=mock_instance, **kwargs)
+                return await test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         return async_wrapper if asyncio.iscoroutinefunction(test_func) else test_func
     
@@ -489,14 +530,14 @@ def mock_qolaba_auth_failure(auth_error_type: str = "invalid_key"):
             error_data = error_responses.get(auth_error_type, error_responses["invalid_key"])
             
             with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-                mock_instance = AsyncMock()
+                mock_instance = AsyncMock(spec=_QolabaAPISpec)
                 mock_client.return_value = mock_instance
                 
                 # Configure all methods to return auth error
                 for method in ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']:
                     getattr(mock_instance, method).return_value = MockHTTPResponse(401, error_data)
                 
-                return await test_func(*args, mock_client=mock_instance, **kwargs)
+                return await test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         @wraps(test_func)
         def sync_wrapper(*args, **kwargs):
@@ -515,7 +556,7 @@ def mock_qolaba_auth_failure(auth_error_type: str = "invalid_key"):
                 for method in ['text_to_image', 'image_to_image', 'text_to_speech', 'chat']:
                     getattr(mock_instance, method).return_value = MockHTTPResponse(401, error_data)
                 
-                return test_func(*args, mock_client=mock_instance, **kwargs)
+                return test_func(*args, **{**kwargs, "mock_client": mock_instance})
         
         return async_wrapper if asyncio.iscoroutinefunction(test_func) else sync_wrapper
     
@@ -527,26 +568,50 @@ def mock_qolaba_auth_failure(auth_error_type: str = "invalid_key"):
 # =============================================================================
 
 class MockStreamingResponse:
-    """Mock streaming response for chat streaming scenarios."""
+    """Mock streaming response for chat streaming scenarios.
     
-    def __init__(self, messages: List[Dict[str, Any]]):
+    ``messages`` may be dicts (JSON-encoded once, up front) or ready-made
+    ``bytes`` chunks, which are streamed as-is.
+    """
+    
+    def __init__(self, messages: List[Union[Dict[str, Any], bytes]]):
         self.messages = messages
+        self._chunks = [
+            message if isinstance(message, bytes) else json.dumps(message).encode('utf-8')
+            for message in messages
+        ]
         self._index = 0
     
-    async def __aiter__(self):
+    def __aiter__(self):
         return self
     
     async def __anext__(self):
-        if self._index >= len(self.messages):
+        if self._index >= len(self._chunks):
             raise StopAsyncIteration
         
-        message = self.messages[self._index]
+        chunk = self._chunks[self._index]
         self._index += 1
         
         # Simulate network delay
         await asyncio.sleep(0.1)
         
-        return json.dumps(message).encode('utf-8')
+        return chunk
+
+
+@lru_cache(maxsize=32)
+def _encode_streaming_chat(contents: Tuple[str, ...]) -> Tuple[bytes, ...]:
+    """JSON-encode chat stream deltas once per distinct message sequence."""
+    last = len(contents) - 1
+    return tuple(
+        json.dumps({
+            "delta": {
+                "content": content,
+                "role": "assistant" if i == 0 else None
+            },
+            "finish_reason": "stop" if i == last else None
+        }).encode('utf-8')
+        for i, content in enumerate(contents)
+    )
 
 
 @asynccontextmanager
@@ -557,21 +622,13 @@ async def mock_qolaba_streaming_chat(messages: List[str]):
     Args:
         messages: List of message contents to stream
     """
-    streaming_messages = []
-    for i, content in enumerate(messages):
-        streaming_messages.append({
-            "delta": {
-                "content": content,
-                "role": "assistant" if i == 0 else None
-            },
-            "finish_reason": "stop" if i == len(messages) - 1 else None
-        })
+    streaming_chunks = list(_encode_streaming_chat(tuple(messages)))
     
     with patch('qolaba_mcp_server.api.client.QolabaHTTPClient') as mock_client:
-        mock_instance = AsyncMock()
+        mock_instance = AsyncMock(spec=_QolabaAPISpec)
         mock_client.return_value = mock_instance
         
-        mock_instance.stream_chat.return_value = MockStreamingResponse(streaming_messages)
+        mock_instance.stream_chat.return_value = MockStreamingResponse(streaming_chunks)
         
         yield mock_instance
 
@@ -590,7 +647,7 @@ def create_mock_api_client(**config_overrides) -> AsyncMock:
     Returns:
         Configured AsyncMock instance
     """
-    mock_client = AsyncMock()
+    mock_client = AsyncMock(spec=_QolabaAPISpec)
     
     # Default successful responses
     mock_client.text_to_image.return_value = MockHTTPResponse(
@@ -628,14 +685,10 @@ def assert_api_call_made(mock_client: AsyncMock, method: str, expected_args: Dic
                 assert call_kwargs[key] == expected_value, f"Expected {key}={expected_value}, got {call_kwargs[key]}"
 
 
-def create_test_scenarios() -> Dict[str, Dict[str, Any]]:
-    """
-    Create common test scenarios for API testing.
-    
-    Returns:
-        Dictionary of test scenarios with mock configurations
-    """
-    return {
+# Common API test scenarios, built once at import and exposed read-only
+_SCENARIOS = MappingProxyType({
+    name: MappingProxyType(scenario)
+    for name, scenario in {
         "success": {
             "status_code": 200,
             "response_data": QolabaMockResponseGenerator.text_to_image_success()
@@ -664,7 +717,21 @@ def create_test_scenarios() -> Dict[str, Dict[str, Any]]:
                 "INTERNAL_SERVER_ERROR", "Server error occurred"
             )
         }
-    }
+    }.items()
+})
+
+
+def create_test_scenarios() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Return common test scenarios for API testing.
+    
+    The scenarios are built once at import; the returned mapping and each
+    scenario are read-only, so copy ``response_data`` before changing it.
+    
+    Returns:
+        Read-only mapping of test scenarios with mock configurations
+    """
+    return _SCENARIOS
 
 
 # Export all utilities for easy importing